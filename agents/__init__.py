@@ -7,19 +7,23 @@ for the distributed multi-agent system.
 
 __version__ = "1.0.0"
 
-from .base import (
-    BaseAgent,
-    AgentType,
-    AgentStatus,
-    AgentCapability,
-    AgentConfig,
-    AgentMessage,
-    AgentMetrics,
-    Task,
-    TaskPriority,
-    TaskStatus,
-    CommunicationProtocol,
-)
+import importlib
+
+# Exported names resolve lazily (PEP 562) so importing a subpackage such as
+# agents.algorithms does not pay for loading agents.base and its models
+_LAZY_IMPORTS = {
+    "BaseAgent": ".base",
+    "AgentType": ".base",
+    "AgentStatus": ".base",
+    "AgentCapability": ".base",
+    "AgentConfig": ".base",
+    "AgentMessage": ".base",
+    "AgentMetrics": ".base",
+    "Task": ".base",
+    "TaskPriority": ".base",
+    "TaskStatus": ".base",
+    "CommunicationProtocol": ".base",
+}
 
 __all__ = [
     "BaseAgent",
@@ -34,3 +38,19 @@ __all__ = [
     "TaskStatus",
     "CommunicationProtocol",
 ]
+
+
+def __getattr__(name):
+    if name == "base":
+        # The eager import used to bind agents.base; importing binds it here
+        return importlib.import_module(".base", __name__)
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | {"base"})
@@ -10,13 +10,47 @@ Key Components:
 - Optimization Algorithms: Genetic, Simulated Annealing, Particle Swarm
 """
 
+import importlib
+
 from .base import Algorithm, AlgorithmType, AlgorithmResult
-from .code_generation import *
-from .problem_solving import *
-from .optimization import *
+
+# Algorithm implementations resolve lazily (PEP 562) so importing the package
+# does not load every generator and solver module up front
+_LAZY_IMPORTS = {
+    "TemplateBasedCodeGenerator": ".code_generation",
+    "ASTBasedCodeGenerator": ".code_generation",
+    "PatternBasedCodeGenerator": ".code_generation",
+    "AIAssistedCodeGenerator": ".code_generation",
+    "DivideAndConquerSolver": ".problem_solving",
+    "BacktrackingSolver": ".problem_solving",
+    "DynamicProgrammingSolver": ".problem_solving",
+    "GreedyAlgorithmSolver": ".problem_solving",
+    "ConstraintSatisfactionSolver": ".problem_solving",
+    "AlgorithmOrchestrator": ".optimization",
+    "ExecutionRecord": ".optimization",
+}
+
+# Subpackages the eager star-imports used to bind as attributes
+_SUBPACKAGES = frozenset({"code_generation", "problem_solving", "optimization"})
 
 __all__ = [
     "Algorithm",
     "AlgorithmType", 
     "AlgorithmResult",
 ]
+
+
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        # Importing binds the subpackage here, so this runs once per name
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _SUBPACKAGES)
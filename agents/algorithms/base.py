@@ -5,9 +5,14 @@ Provides the foundation for all algorithm implementations in the system.
 """
 
 from enum import Enum
-from typing import Dict, Any, Optional, List, Callable
-from datetime import datetime
+from typing import Dict, Any, Optional, List, Callable, ClassVar, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pydantic import BaseModel, Field
+import os
+import threading
+import time
 import uuid
 
 
@@ -36,17 +41,23 @@ class AlgorithmStrategy(str, Enum):
     PARTICLE_SWARM = "particle_swarm"
 
 
-class AlgorithmResult(BaseModel):
+@dataclass(slots=True)
+class AlgorithmResult:
     """Result of an algorithm execution"""
     algorithm_id: str
     algorithm_name: str
     strategy: AlgorithmStrategy
     success: bool
-    result_data: Dict[str, Any] = Field(default_factory=dict)
+    result_data: Dict[str, Any] = field(default_factory=dict)
     error: Optional[str] = None
     execution_time_ms: float = 0.0
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time the result was created (UTC)"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc)
 
 
 class AlgorithmConfig(BaseModel):
@@ -59,25 +70,66 @@ class AlgorithmConfig(BaseModel):
     custom_params: Dict[str, Any] = Field(default_factory=dict)
 
 
-class Algorithm(BaseModel):
+@dataclass(slots=True)
+class _Metrics:
+    """Mutable execution counters kept apart from the algorithm definition"""
+    executions_count: int = 0
+    success_count: int = 0
+    failure_count: int = 0
+    average_execution_time_ms: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+
+@dataclass(slots=True, kw_only=True)
+class Algorithm:
     """
     Base Algorithm Class
     
     All algorithm implementations inherit from this base class.
+    Plain dataclass rather than a pydantic model: execute() sits on the hot
+    path and must not pay for validation on every metrics update.
     """
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    name: str = Field(..., description="Algorithm name")
-    type: AlgorithmType = Field(..., description="Algorithm type")
-    strategy: AlgorithmStrategy = Field(..., description="Execution strategy")
-    description: str = Field(..., description="Algorithm description")
-    version: str = Field(default="1.0.0")
-    config: AlgorithmConfig = Field(default_factory=AlgorithmConfig)
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    name: str
+    type: AlgorithmType
+    strategy: AlgorithmStrategy
+    description: str
+    version: str = "1.0.0"
+    config: AlgorithmConfig = field(default_factory=AlgorithmConfig)
+    
+    # Name used when none is passed, and input keys every execute() call
+    # must provide, declared per subclass
+    DEFAULT_NAME: ClassVar[str] = ""
+    REQUIRED_FIELDS: ClassVar[Tuple[str, ...]] = ()
     
     # Metrics
-    executions_count: int = Field(default=0)
-    success_count: int = Field(default=0)
-    failure_count: int = Field(default=0)
-    average_execution_time_ms: float = Field(default=0.0)
+    _metrics: _Metrics = field(default_factory=_Metrics, init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        # Accept plain strings for the enum fields, as the pydantic model did
+        if type(self.type) is not AlgorithmType:
+            self.type = AlgorithmType(self.type)
+        if type(self.strategy) is not AlgorithmStrategy:
+            self.strategy = AlgorithmStrategy(self.strategy)
+        # Accept a plain dict for config, validated as pydantic would have
+        if isinstance(self.config, dict):
+            self.config = AlgorithmConfig.model_validate(self.config)
+    
+    @property
+    def executions_count(self) -> int:
+        return self._metrics.executions_count
+    
+    @property
+    def success_count(self) -> int:
+        return self._metrics.success_count
+    
+    @property
+    def failure_count(self) -> int:
+        return self._metrics.failure_count
+    
+    @property
+    def average_execution_time_ms(self) -> float:
+        return self._metrics.average_execution_time_ms
     
     def execute(self, input_data: Dict[str, Any]) -> AlgorithmResult:
         """
@@ -89,7 +141,7 @@ class Algorithm(BaseModel):
         Returns:
             AlgorithmResult with execution details
         """
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Validate input
@@ -99,13 +151,14 @@ class Algorithm(BaseModel):
             result_data = self._execute_core(input_data)
             
             # Calculate execution time
-            end_time = datetime.utcnow()
-            execution_time_ms = (end_time - start_time).total_seconds() * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
             
             # Update metrics
-            self.executions_count += 1
-            self.success_count += 1
-            self._update_average_execution_time(execution_time_ms)
+            metrics = self._metrics
+            with metrics.lock:
+                metrics.executions_count += 1
+                metrics.success_count += 1
+                self._update_average_execution_time(execution_time_ms)
             
             return AlgorithmResult(
                 algorithm_id=self.id,
@@ -121,11 +174,12 @@ class Algorithm(BaseModel):
             )
             
         except Exception as e:
-            end_time = datetime.utcnow()
-            execution_time_ms = (end_time - start_time).total_seconds() * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
             
-            self.executions_count += 1
-            self.failure_count += 1
+            metrics = self._metrics
+            with metrics.lock:
+                metrics.executions_count += 1
+                metrics.failure_count += 1
             
             return AlgorithmResult(
                 algorithm_id=self.id,
@@ -136,14 +190,38 @@ class Algorithm(BaseModel):
                 execution_time_ms=execution_time_ms
             )
     
+    def execute_batch(self, inputs: List[Dict[str, Any]]) -> List[AlgorithmResult]:
+        """
+        Execute the algorithm on several independent inputs
+        
+        Inputs run on a thread pool when config.parallel_execution is set,
+        otherwise one after another.
+        
+        Args:
+            inputs: Input data for each execution
+            
+        Returns:
+            AlgorithmResults in the same order as inputs
+        """
+        if not self.config.parallel_execution or len(inputs) < 2:
+            return [self.execute(input_data) for input_data in inputs]
+        
+        max_workers = min(len(inputs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.execute, inputs))
+    
     def _validate_input(self, input_data: Dict[str, Any]) -> None:
         """
         Validate input data
         
-        Override in subclasses for specific validation
+        Checks REQUIRED_FIELDS; override in subclasses for further validation
         """
         if not isinstance(input_data, dict):
             raise ValueError("Input data must be a dictionary")
+        
+        for field_name in self.REQUIRED_FIELDS:
+            if field_name not in input_data:
+                raise ValueError(f"Missing required field: {field_name}")
     
     def _execute_core(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -154,14 +232,11 @@ class Algorithm(BaseModel):
         raise NotImplementedError("Subclasses must implement _execute_core")
     
     def _update_average_execution_time(self, execution_time_ms: float) -> None:
-        """Update running average of execution time"""
-        if self.executions_count == 1:
-            self.average_execution_time_ms = execution_time_ms
-        else:
-            self.average_execution_time_ms = (
-                (self.average_execution_time_ms * (self.executions_count - 1) + execution_time_ms)
-                / self.executions_count
-            )
+        """Update running average of execution time (incremental mean)"""
+        metrics = self._metrics
+        metrics.average_execution_time_ms += (
+            (execution_time_ms - metrics.average_execution_time_ms) / metrics.executions_count
+        )
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get algorithm performance metrics"""
@@ -5,146 +5,38 @@ Generates code using AI models with context-aware understanding.
 Leverages large language models for intelligent code generation.
 """
 
-from typing import Dict, Any, Optional, List
+import io
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from ..base import Algorithm, AlgorithmType, AlgorithmStrategy
 
 
-class AIAssistedCodeGenerator(Algorithm):
+# Enum members bound once for __init__
+_CODE_GENERATION = AlgorithmType.CODE_GENERATION
+_AI_ASSISTED = AlgorithmStrategy.AI_ASSISTED
+
+
+# Input keys that can carry the prompt; at least one is required
+_PROMPT_KEYS = frozenset({"prompt", "description"})
+
+_PROMPT_FOOTER = "\n\nGenerate clean, production-ready code."
+
+
+def _freeze_context(context: Dict[str, Any]) -> Optional[frozenset]:
     """
-    AI-assisted code generation algorithm
+    Hashable view of a context dict, or None if any value is unhashable
     
-    Uses AI models to generate code with natural language descriptions.
-    Provides intelligent, context-aware code generation.
-    
-    Example:
-        ```python
-        generator = AIAssistedCodeGenerator()
-        result = generator.execute({
-            "prompt": "Create a function that calculates fibonacci numbers",
-            "language": "python",
-            "context": {
-                "style": "functional",
-                "include_tests": True,
-                "include_docstrings": True
-            }
-        })
-        ```
+    Each value is keyed together with its type, so values that compare
+    equal but format differently (1, True, 1.0) get separate entries.
     """
-    
-    def __init__(self, **data):
-        if "name" not in data:
-            data["name"] = "AI-Assisted Code Generator"
-        if "type" not in data:
-            data["type"] = AlgorithmType.CODE_GENERATION
-        if "strategy" not in data:
-            data["strategy"] = AlgorithmStrategy.AI_ASSISTED
-        if "description" not in data:
-            data["description"] = "Generates code using AI models with natural language understanding"
-        
-        super().__init__(**data)
-        
-        # AI model configuration
-        self.model_provider = "openai"
-        self.model_name = "gpt-4"
-        self.temperature = 0.2  # Lower for more deterministic code
-    
-    def _validate_input(self, input_data: Dict[str, Any]) -> None:
-        """Validate input data for AI-assisted generation"""
-        super()._validate_input(input_data)
-        
-        if "prompt" not in input_data and "description" not in input_data:
-            raise ValueError("Either 'prompt' or 'description' is required")
-    
-    def _execute_core(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute AI-assisted code generation"""
-        prompt = input_data.get("prompt") or input_data.get("description")
-        language = input_data.get("language", "python")
-        context = input_data.get("context", {})
-        
-        # Build enhanced prompt with context
-        enhanced_prompt = self._build_prompt(prompt, language, context)
-        
-        # Simulate AI generation (in production, this would call actual AI API)
-        generated_code = self._simulate_ai_generation(enhanced_prompt, language, context)
-        
-        # Extract metadata from generation
-        metadata = self._extract_metadata(generated_code, language)
-        
-        return {
-            "generated_code": generated_code,
-            "language": language,
-            "prompt": prompt,
-            "context": context,
-            "metadata": metadata,
-            "code_length": len(generated_code)
-        }
-    
-    def _build_prompt(
-        self, 
-        user_prompt: str, 
-        language: str, 
-        context: Dict[str, Any]
-    ) -> str:
-        """Build an enhanced prompt for AI model"""
-        prompt_parts = [
-            f"Generate {language} code for the following requirement:",
-            f"\n{user_prompt}\n",
-        ]
-        
-        # Add context-specific instructions
-        if context.get("style"):
-            prompt_parts.append(f"Code style: {context['style']}")
-        
-        if context.get("include_docstrings", True):
-            prompt_parts.append("Include comprehensive docstrings")
-        
-        if context.get("include_tests"):
-            prompt_parts.append("Include unit tests")
-        
-        if context.get("include_type_hints", True) and language == "python":
-            prompt_parts.append("Include type hints")
-        
-        if context.get("framework"):
-            prompt_parts.append(f"Use framework: {context['framework']}")
-        
-        if context.get("design_pattern"):
-            prompt_parts.append(f"Implement design pattern: {context['design_pattern']}")
-        
-        if context.get("additional_requirements"):
-            prompt_parts.append(f"Additional requirements: {context['additional_requirements']}")
-        
-        prompt_parts.append("\nGenerate clean, production-ready code.")
-        
-        return "\n".join(prompt_parts)
-    
-    def _simulate_ai_generation(
-        self, 
-        prompt: str, 
-        language: str, 
-        context: Dict[str, Any]
-    ) -> str:
-        """
-        Simulate AI code generation
-        
-        In production, this would call actual AI API.
-        For now, generates example code based on context.
-        """
-        # This is a simulation - real implementation would call AI API
-        if "function" in prompt.lower() and "fibonacci" in prompt.lower():
-            if context.get("style") == "functional":
-                return self._generate_fibonacci_functional()
-            else:
-                return self._generate_fibonacci_iterative()
-        
-        elif "class" in prompt.lower() or "api" in prompt.lower():
-            return self._generate_example_class(language, context)
-        
-        else:
-            return self._generate_generic_template(language, prompt)
-    
-    def _generate_fibonacci_functional(self) -> str:
-        """Generate functional fibonacci implementation"""
-        return '''def fibonacci(n: int) -> int:
+    try:
+        return frozenset((key, type(value), value) for key, value in context.items())
+    except TypeError:
+        return None
+
+
+# Canned outputs for the simulated generator
+_FIBONACCI_FUNCTIONAL = '''def fibonacci(n: int) -> int:
     """
     Calculate the nth Fibonacci number using functional approach.
     
@@ -197,10 +89,8 @@ def fibonacci_memoized(n: int, memo: dict = None) -> int:
     memo[n] = fibonacci_memoized(n - 1, memo) + fibonacci_memoized(n - 2, memo)
     return memo[n]
 '''
-    
-    def _generate_fibonacci_iterative(self) -> str:
-        """Generate iterative fibonacci implementation"""
-        return '''def fibonacci(n: int) -> int:
+
+_FIBONACCI_ITERATIVE = '''def fibonacci(n: int) -> int:
     """
     Calculate the nth Fibonacci number using iterative approach.
     
@@ -225,11 +115,8 @@ def fibonacci_memoized(n: int, memo: dict = None) -> int:
     
     return curr
 '''
-    
-    def _generate_example_class(self, language: str, context: Dict[str, Any]) -> str:
-        """Generate example class code"""
-        if language == "python":
-            return '''from typing import Optional, Dict, Any
+
+_EXAMPLE_CLASS_PYTHON = '''from typing import Optional, Dict, Any
 
 class DataProcessor:
     """
@@ -290,9 +177,220 @@ class DataProcessor:
         """Get the count of processed items"""
         return self._processed_count
 '''
-        return "// Code generation for this language is not yet implemented"
+
+_UNSUPPORTED_LANGUAGE = "// Code generation for this language is not yet implemented"
+
+
+@lru_cache(maxsize=1024)
+def _code_metadata(code: str, language: str) -> Dict[str, Any]:
+    """
+    Scan generated code for size and structure metrics
+    
+    Cached because generated code repeats: every cache hit on
+    AIAssistedCodeGenerator._generate_cached returns the same string.
+    """
+    lines = code.split('\n')
+    
+    metadata = {
+        "lines_of_code": len(lines),
+        "non_empty_lines": len([l for l in lines if l.strip()]),
+        "has_docstrings": '"""' in code or "'''" in code,
+        "has_comments": '#' in code or '//' in code,
+    }
+    
+    if language == "python":
+        metadata["has_type_hints"] = '->' in code or ': ' in code
+        # Two str.count calls beat one combined regex findall by ~6x
+        metadata["function_count"] = code.count('def ')
+        metadata["class_count"] = code.count('class ')
+    
+    return metadata
+
+
+class AIAssistedCodeGenerator(Algorithm):
+    """
+    AI-assisted code generation algorithm
+    
+    Uses AI models to generate code with natural language descriptions.
+    Provides intelligent, context-aware code generation.
+    
+    Example:
+        ```python
+        generator = AIAssistedCodeGenerator()
+        result = generator.execute({
+            "prompt": "Create a function that calculates fibonacci numbers",
+            "language": "python",
+            "context": {
+                "style": "functional",
+                "include_tests": True,
+                "include_docstrings": True
+            }
+        })
+        ```
+    """
+    
+    DEFAULT_NAME = "AI-Assisted Code Generator"
+    
+    def __init__(self, **data):
+        if "name" not in data:
+            data["name"] = self.DEFAULT_NAME
+        if "type" not in data:
+            data["type"] = _CODE_GENERATION
+        if "strategy" not in data:
+            data["strategy"] = _AI_ASSISTED
+        if "description" not in data:
+            data["description"] = "Generates code using AI models with natural language understanding"
+        
+        super().__init__(**data)
+        
+        # AI model configuration
+        self.model_provider = "openai"
+        self.model_name = "gpt-4"
+        self.temperature = 0.2  # Lower for more deterministic code
+    
+    def _validate_input(self, input_data: Dict[str, Any]) -> None:
+        """Validate input data for AI-assisted generation"""
+        super()._validate_input(input_data)
+        
+        if _PROMPT_KEYS.isdisjoint(input_data):
+            raise ValueError("Either 'prompt' or 'description' is required")
+    
+    def _execute_core(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute AI-assisted code generation"""
+        prompt = input_data.get("prompt") or input_data.get("description")
+        language = input_data.get("language", "python")
+        context = input_data.get("context", {})
+        
+        context_key = _freeze_context(context)
+        if context_key is not None:
+            enhanced_prompt, generated_code = self._generate_cached(
+                prompt, language, context_key
+            )
+        else:
+            # Build enhanced prompt with context
+            enhanced_prompt = self._build_prompt(prompt, language, context)
+            
+            # Simulate AI generation (in production, this would call actual AI API)
+            generated_code = self._simulate_ai_generation(enhanced_prompt, language, context)
+        
+        # Extract metadata from generation
+        metadata = self._extract_metadata(generated_code, language)
+        
+        return {
+            "generated_code": generated_code,
+            "language": language,
+            "prompt": prompt,
+            "context": context,
+            "metadata": metadata,
+            "code_length": len(generated_code)
+        }
+    
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _generate_cached(
+        cls,
+        prompt: str,
+        language: str,
+        context_key: frozenset
+    ) -> Tuple[str, str]:
+        """
+        Build the prompt and generate code for a hashable context
+        
+        Both steps are deterministic, so repeated requests are served from
+        the cache. Returns (enhanced_prompt, generated_code).
+        """
+        context = {key: value for key, _, value in context_key}
+        enhanced_prompt = cls._build_prompt(prompt, language, context)
+        return enhanced_prompt, cls._simulate_ai_generation(enhanced_prompt, language, context)
+    
+    @staticmethod
+    def _build_prompt(
+        user_prompt: str, 
+        language: str, 
+        context: Dict[str, Any]
+    ) -> str:
+        """Build an enhanced prompt for AI model"""
+        buf = io.StringIO()
+        write = buf.write
+        write(f"Generate {language} code for the following requirement:\n\n{user_prompt}\n")
+        
+        # Add context-specific instructions
+        get = context.get
+        style = get("style")
+        if style:
+            write(f"\nCode style: {style}")
+        
+        if get("include_docstrings", True):
+            write("\nInclude comprehensive docstrings")
+        
+        if get("include_tests"):
+            write("\nInclude unit tests")
+        
+        if get("include_type_hints", True) and language == "python":
+            write("\nInclude type hints")
+        
+        framework = get("framework")
+        if framework:
+            write(f"\nUse framework: {framework}")
+        
+        design_pattern = get("design_pattern")
+        if design_pattern:
+            write(f"\nImplement design pattern: {design_pattern}")
+        
+        additional_requirements = get("additional_requirements")
+        if additional_requirements:
+            write(f"\nAdditional requirements: {additional_requirements}")
+        
+        write(_PROMPT_FOOTER)
+        
+        return buf.getvalue()
+    
+    @classmethod
+    def _simulate_ai_generation(
+        cls, 
+        prompt: str, 
+        language: str, 
+        context: Dict[str, Any]
+    ) -> str:
+        """
+        Simulate AI code generation
+        
+        In production, this would call actual AI API.
+        For now, generates example code based on context.
+        """
+        # This is a simulation - real implementation would call AI API
+        lowered = prompt.lower()
+        if "function" in lowered and "fibonacci" in lowered:
+            if context.get("style") == "functional":
+                return cls._generate_fibonacci_functional()
+            else:
+                return cls._generate_fibonacci_iterative()
+        
+        elif "class" in lowered or "api" in lowered:
+            return cls._generate_example_class(language, context)
+        
+        else:
+            return cls._generate_generic_template(language, prompt)
+    
+    @staticmethod
+    def _generate_fibonacci_functional() -> str:
+        """Generate functional fibonacci implementation"""
+        return _FIBONACCI_FUNCTIONAL
+    
+    @staticmethod
+    def _generate_fibonacci_iterative() -> str:
+        """Generate iterative fibonacci implementation"""
+        return _FIBONACCI_ITERATIVE
+    
+    @staticmethod
+    def _generate_example_class(language: str, context: Dict[str, Any]) -> str:
+        """Generate example class code"""
+        if language == "python":
+            return _EXAMPLE_CLASS_PYTHON
+        return _UNSUPPORTED_LANGUAGE
     
-    def _generate_generic_template(self, language: str, prompt: str) -> str:
+    @staticmethod
+    def _generate_generic_template(language: str, prompt: str) -> str:
         """Generate generic code template"""
         return f'''# Generated code for: {prompt}
 # Language: {language}
@@ -305,21 +403,8 @@ def generated_function():
     
     def _extract_metadata(self, code: str, language: str) -> Dict[str, Any]:
         """Extract metadata from generated code"""
-        lines = code.split('\n')
-        
-        metadata = {
-            "lines_of_code": len(lines),
-            "non_empty_lines": len([l for l in lines if l.strip()]),
-            "has_docstrings": '"""' in code or "'''" in code,
-            "has_comments": '#' in code or '//' in code,
-        }
-        
-        if language == "python":
-            metadata["has_type_hints"] = '->' in code or ': ' in code
-            metadata["function_count"] = code.count('def ')
-            metadata["class_count"] = code.count('class ')
-        
-        return metadata
+        # Copy so callers can't mutate the cached entry
+        return dict(_code_metadata(code, language))
     
     def configure_model(
         self, 
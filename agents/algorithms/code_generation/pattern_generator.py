@@ -5,10 +5,104 @@ Generates code based on recognized design patterns and best practices.
 Implements common software design patterns automatically.
 """
 
-from typing import Dict, Any, List, Optional
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Callable
 from ..base import Algorithm, AlgorithmType, AlgorithmStrategy
 
 
+# Import line shared by the ABC-based pattern templates
+_ABC_IMPORT = "from abc import ABC, abstractmethod\n"
+
+_PLACEHOLDER = re.compile(r"\$\{\{(\w+)\}\}")
+
+
+def _to_format_template(template: str) -> str:
+    """Rewrite ${name} placeholders as str.format fields, escaping other braces"""
+    escaped = template.replace("{", "{{").replace("}", "}}")
+    return _PLACEHOLDER.sub(r"{\1}", escaped)
+
+
+def _format_patterns(
+    patterns: Dict[str, Dict[str, str]]
+) -> Dict[str, Dict[str, str]]:
+    """Rewrite every pattern source for str.format_map"""
+    return {
+        pattern: {language: _to_format_template(source) for language, source in sources.items()}
+        for pattern, sources in patterns.items()
+    }
+
+
+class _KeepMissing(dict):
+    """Mapping that leaves unknown placeholders as ${name}, like safe_substitute"""
+    
+    def __missing__(self, key: str) -> str:
+        return f"${{{key}}}"
+
+
+def _prep_singleton(input_data: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        "class_name": input_data.get("class_name", "Singleton"),
+        "additional_methods": "\n".join([
+            f"    def {method}(self):\n        pass\n"
+            for method in input_data.get("additional_methods", [])
+        ]),
+    }
+
+
+def _prep_factory(input_data: Dict[str, Any]) -> Dict[str, str]:
+    product_interface = input_data.get("product_interface", "Product")
+    return {
+        "product_interface": product_interface,
+        "factory_name": input_data.get("factory_name", "ProductFactory"),
+        "concrete_products": "\n\n".join([
+            f"class {product}({product_interface}):\n    def operation(self) -> str:\n        return \"{product} operation\""
+            for product in input_data.get("concrete_products", [])
+        ]),
+    }
+
+
+def _prep_observer(input_data: Dict[str, Any]) -> Dict[str, str]:
+    return {"observer_name": input_data.get("observer_name", "ConcreteObserver")}
+
+
+def _prep_strategy(input_data: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        "concrete_strategies": "\n\n".join([
+            f"class {strategy}(Strategy):\n    def execute(self, data: Any) -> Any:\n        return data  # Implement strategy logic"
+            for strategy in input_data.get("concrete_strategies", [])
+        ]),
+    }
+
+
+def _prep_builder(input_data: Dict[str, Any]) -> Dict[str, str]:
+    attributes = input_data.get("attributes", [])
+    return {
+        "product_name": input_data.get("product_name", "Product"),
+        "builder_name": input_data.get("builder_name", "ProductBuilder"),
+        "product_attributes": "\n".join([f"        self.{attr} = None" for attr in attributes]),
+        "builder_methods": "\n\n".join([
+            f"    def set_{attr}(self, value):\n        self._product.{attr} = value\n        return self"
+            for attr in attributes
+        ]),
+    }
+
+
+def _prep_adapter(input_data: Dict[str, Any]) -> Dict[str, str]:
+    return {"adapter_name": input_data.get("adapter_name", "Adapter")}
+
+
+# Per-pattern template variable builders
+_PREPARERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, str]]] = {
+    "singleton": _prep_singleton,
+    "factory": _prep_factory,
+    "observer": _prep_observer,
+    "strategy": _prep_strategy,
+    "builder": _prep_builder,
+    "adapter": _prep_adapter,
+}
+
+
 class PatternBasedCodeGenerator(Algorithm):
     """
     Pattern-based code generation algorithm
@@ -53,8 +147,7 @@ ${additional_methods}
 """,
         },
         "factory": {
-            "python": """from abc import ABC, abstractmethod
-from typing import Dict, Type
+            "python": _ABC_IMPORT + """from typing import Dict, Type
 
 class ${product_interface}(ABC):
     \"\"\"Product interface\"\"\"
@@ -84,8 +177,7 @@ class ${factory_name}:
 """,
         },
         "observer": {
-            "python": """from abc import ABC, abstractmethod
-from typing import List
+            "python": _ABC_IMPORT + """from typing import List
 
 class Observer(ABC):
     \"\"\"Observer interface\"\"\"
@@ -133,8 +225,7 @@ class ${observer_name}(Observer):
 """,
         },
         "strategy": {
-            "python": """from abc import ABC, abstractmethod
-from typing import Any
+            "python": _ABC_IMPORT + """from typing import Any
 
 class Strategy(ABC):
     \"\"\"Strategy interface\"\"\"
@@ -195,8 +286,7 @@ ${builder_methods}
 """,
         },
         "adapter": {
-            "python": """from abc import ABC, abstractmethod
-
+            "python": _ABC_IMPORT + """
 class Target(ABC):
     \"\"\"Target interface that client uses\"\"\"
     
@@ -223,9 +313,30 @@ class ${adapter_name}(Target):
         },
     }
     
+    # PATTERNS rewritten once for str.format_map
+    _FORMAT_PATTERNS = _format_patterns(PATTERNS)
+    
+    # Key listings for the introspection methods; PATTERNS is fixed at import
+    _PATTERN_NAMES = tuple(PATTERNS)
+    _PATTERN_LANGUAGES = {pattern: tuple(sources) for pattern, sources in PATTERNS.items()}
+    
+    DEFAULT_NAME = "Pattern-Based Code Generator"
+    REQUIRED_FIELDS = ("pattern",)
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Subclasses that replace PATTERNS get their own derived tables,
+        # built once here rather than per instance or per request
+        if "PATTERNS" in cls.__dict__:
+            cls._FORMAT_PATTERNS = _format_patterns(cls.PATTERNS)
+            cls._PATTERN_NAMES = tuple(cls.PATTERNS)
+            cls._PATTERN_LANGUAGES = {
+                pattern: tuple(sources) for pattern, sources in cls.PATTERNS.items()
+            }
+    
     def __init__(self, **data):
         if "name" not in data:
-            data["name"] = "Pattern-Based Code Generator"
+            data["name"] = self.DEFAULT_NAME
         if "type" not in data:
             data["type"] = AlgorithmType.CODE_GENERATION
         if "strategy" not in data:
@@ -239,9 +350,6 @@ class ${adapter_name}(Target):
         """Validate input data for pattern-based generation"""
         super()._validate_input(input_data)
         
-        if "pattern" not in input_data:
-            raise ValueError("Missing required field: pattern")
-        
         pattern = input_data["pattern"]
         if pattern not in self.PATTERNS:
             available = ", ".join(self.PATTERNS.keys())
@@ -255,13 +363,15 @@ class ${adapter_name}(Target):
         if language not in self.PATTERNS[pattern]:
             raise ValueError(f"Pattern {pattern} not available for language {language}")
         
-        template = self.PATTERNS[pattern][language]
         variables = self._prepare_pattern_variables(pattern, input_data)
-        
-        # Simple substitution
-        generated_code = template
-        for key, value in variables.items():
-            generated_code = generated_code.replace(f"${{{key}}}", str(value))
+        if variables:
+            # format_map renders str(value), so the stringified items are an
+            # exact, always-hashable cache key
+            variables_key = frozenset((key, str(value)) for key, value in variables.items())
+            generated_code = self._render_cached(pattern, language, variables_key)
+        else:
+            # Nothing to substitute: placeholders stay as written
+            generated_code = self.PATTERNS[pattern][language]
         
         return {
             "generated_code": generated_code,
@@ -271,64 +381,29 @@ class ${adapter_name}(Target):
             "code_length": len(generated_code)
         }
     
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _render_cached(
+        cls,
+        pattern: str,
+        language: str,
+        variables_key: frozenset
+    ) -> str:
+        """Render a pattern; the output depends only on the arguments"""
+        return cls._FORMAT_PATTERNS[pattern][language].format_map(_KeepMissing(variables_key))
+    
     def _prepare_pattern_variables(
         self, 
         pattern: str, 
         input_data: Dict[str, Any]
     ) -> Dict[str, str]:
         """Prepare variables for pattern template"""
-        variables = {}
-        
-        if pattern == "singleton":
-            variables["class_name"] = input_data.get("class_name", "Singleton")
-            additional_methods = input_data.get("additional_methods", [])
-            methods_code = "\n".join([
-                f"    def {method}(self):\n        pass\n"
-                for method in additional_methods
-            ])
-            variables["additional_methods"] = methods_code
-        
-        elif pattern == "factory":
-            variables["product_interface"] = input_data.get("product_interface", "Product")
-            variables["factory_name"] = input_data.get("factory_name", "ProductFactory")
-            concrete_products = input_data.get("concrete_products", [])
-            products_code = "\n\n".join([
-                f"class {product}({variables['product_interface']}):\n    def operation(self) -> str:\n        return \"{product} operation\""
-                for product in concrete_products
-            ])
-            variables["concrete_products"] = products_code
-        
-        elif pattern == "observer":
-            variables["observer_name"] = input_data.get("observer_name", "ConcreteObserver")
-        
-        elif pattern == "strategy":
-            concrete_strategies = input_data.get("concrete_strategies", [])
-            strategies_code = "\n\n".join([
-                f"class {strategy}(Strategy):\n    def execute(self, data: Any) -> Any:\n        return data  # Implement strategy logic"
-                for strategy in concrete_strategies
-            ])
-            variables["concrete_strategies"] = strategies_code
-        
-        elif pattern == "builder":
-            variables["product_name"] = input_data.get("product_name", "Product")
-            variables["builder_name"] = input_data.get("builder_name", "ProductBuilder")
-            attributes = input_data.get("attributes", [])
-            attr_code = "\n".join([f"        self.{attr} = None" for attr in attributes])
-            variables["product_attributes"] = attr_code
-            methods_code = "\n\n".join([
-                f"    def set_{attr}(self, value):\n        self._product.{attr} = value\n        return self"
-                for attr in attributes
-            ])
-            variables["builder_methods"] = methods_code
-        
-        elif pattern == "adapter":
-            variables["adapter_name"] = input_data.get("adapter_name", "Adapter")
-        
-        return variables
+        preparer = _PREPARERS.get(pattern)
+        return preparer(input_data) if preparer else {}
     
     def list_patterns(self) -> List[str]:
         """List all available patterns"""
-        return list(self.PATTERNS.keys())
+        return list(self._PATTERN_NAMES)
     
     def get_pattern_info(self, pattern: str) -> Dict[str, Any]:
         """Get information about a specific pattern"""
@@ -337,7 +412,7 @@ class ${adapter_name}(Target):
         
         return {
             "pattern": pattern,
-            "supported_languages": list(self.PATTERNS[pattern].keys()),
+            "supported_languages": list(self._PATTERN_LANGUAGES[pattern]),
             "description": self._get_pattern_description(pattern)
         }
     
@@ -5,11 +5,22 @@ Generates code using predefined templates with variable substitution.
 Ideal for standardized code patterns and boilerplate generation.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from string import Template
 from ..base import Algorithm, AlgorithmType, AlgorithmStrategy
 
 
+def _compile_templates(
+    templates: Dict[str, Dict[str, str]]
+) -> Dict[str, Dict[str, Template]]:
+    """Parse every template source into a string.Template"""
+    return {
+        language: {name: Template(source) for name, source in sources.items()}
+        for language, sources in templates.items()
+    }
+
+
 class TemplateBasedCodeGenerator(Algorithm):
     """
     Template-based code generation algorithm
@@ -122,9 +133,28 @@ ${methods}
         },
     }
     
+    # Parsed string.Template objects, built once instead of per execution
+    _COMPILED_TEMPLATES = _compile_templates(TEMPLATES)
+    
+    # Template names per language, kept in step with TEMPLATES
+    _TEMPLATE_NAMES = {language: tuple(templates) for language, templates in TEMPLATES.items()}
+    
+    DEFAULT_NAME = "Template-Based Code Generator"
+    REQUIRED_FIELDS = ("template_name", "language", "variables")
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Subclasses that replace TEMPLATES get their own compiled tables,
+        # built once here rather than per instance or per request
+        if "TEMPLATES" in cls.__dict__:
+            cls._COMPILED_TEMPLATES = _compile_templates(cls.TEMPLATES)
+            cls._TEMPLATE_NAMES = {
+                language: tuple(templates) for language, templates in cls.TEMPLATES.items()
+            }
+    
     def __init__(self, **data):
         if "name" not in data:
-            data["name"] = "Template-Based Code Generator"
+            data["name"] = self.DEFAULT_NAME
         if "type" not in data:
             data["type"] = AlgorithmType.CODE_GENERATION
         if "strategy" not in data:
@@ -138,11 +168,6 @@ ${methods}
         """Validate input data for template-based generation"""
         super()._validate_input(input_data)
         
-        required_fields = ["template_name", "language", "variables"]
-        for field in required_fields:
-            if field not in input_data:
-                raise ValueError(f"Missing required field: {field}")
-        
         language = input_data["language"]
         template_name = input_data["template_name"]
         
@@ -158,15 +183,15 @@ ${methods}
         template_name = input_data["template_name"]
         variables = input_data["variables"]
         
-        # Get template
         template_str = self.TEMPLATES[language][template_name]
-        template = Template(template_str)
-        
-        # Apply variables
-        try:
-            generated_code = template.safe_substitute(variables)
-        except KeyError as e:
-            raise ValueError(f"Missing template variable: {e}")
+        if "$" not in template_str:
+            # No placeholders or $$ escapes, so substitution is the identity
+            generated_code = template_str
+        else:
+            # Template substitutes str(value), so the stringified items are an
+            # exact, always-hashable cache key
+            variables_key = frozenset((key, str(value)) for key, value in variables.items())
+            generated_code = self._render_cached(language, template_name, variables_key)
         
         return {
             "generated_code": generated_code,
@@ -174,9 +199,20 @@ ${methods}
             "template_name": template_name,
             "variables_used": list(variables.keys()),
             "code_length": len(generated_code),
-            "lines_of_code": len(generated_code.split('\n'))
+            "lines_of_code": generated_code.count('\n') + 1
         }
     
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _render_cached(
+        cls,
+        language: str,
+        template_name: str,
+        variables_key: frozenset
+    ) -> str:
+        """Substitute variables into a template; cleared when templates change"""
+        return cls._COMPILED_TEMPLATES[language][template_name].safe_substitute(dict(variables_key))
+    
     def add_custom_template(
         self, 
         language: str, 
@@ -193,8 +229,12 @@ ${methods}
         """
         if language not in self.TEMPLATES:
             self.TEMPLATES[language] = {}
+            self._COMPILED_TEMPLATES[language] = {}
         
         self.TEMPLATES[language][template_name] = template_str
+        self._COMPILED_TEMPLATES[language][template_name] = Template(template_str)
+        self._TEMPLATE_NAMES[language] = tuple(self.TEMPLATES[language])
+        self._render_cached.cache_clear()
     
     def list_templates(self, language: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -208,10 +248,10 @@ ${methods}
         """
         if language:
             return {
-                language: list(self.TEMPLATES.get(language, {}).keys())
+                language: list(self._TEMPLATE_NAMES.get(language, ()))
             }
         
         return {
-            lang: list(templates.keys())
-            for lang, templates in self.TEMPLATES.items()
+            lang: list(names)
+            for lang, names in self._TEMPLATE_NAMES.items()
         }
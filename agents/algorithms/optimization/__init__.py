@@ -4,8 +4,9 @@ Optimization Algorithms
 Advanced optimization algorithms for multi-agentic systems.
 """
 
-from .algorithm_orchestrator import AlgorithmOrchestrator
+from .algorithm_orchestrator import AlgorithmOrchestrator, ExecutionRecord
 
 __all__ = [
     "AlgorithmOrchestrator",
+    "ExecutionRecord",
 ]
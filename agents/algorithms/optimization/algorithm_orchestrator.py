@@ -5,7 +5,12 @@ Coordinates multiple algorithms to solve complex problems by selecting
 the most appropriate algorithm based on problem characteristics.
 """
 
-from typing import Dict, Any, List, Optional
+import re
+from collections import deque
+from dataclasses import dataclass
+from collections.abc import Iterator, Mapping
+from itertools import islice
+from typing import Dict, Any, List, Optional, Deque, Type
 from ..base import Algorithm, AlgorithmType, AlgorithmStrategy, AlgorithmResult
 from ..code_generation import (
     TemplateBasedCodeGenerator,
@@ -22,6 +27,162 @@ from ..problem_solving import (
 )
 
 
+# Algorithm classes the orchestrator can dispatch to
+_CODE_GENERATORS: Dict[str, Type[Algorithm]] = {
+    "template": TemplateBasedCodeGenerator,
+    "ast": ASTBasedCodeGenerator,
+    "pattern": PatternBasedCodeGenerator,
+    "ai": AIAssistedCodeGenerator
+}
+_PROBLEM_SOLVERS: Dict[str, Type[Algorithm]] = {
+    "divide_conquer": DivideAndConquerSolver,
+    "backtracking": BacktrackingSolver,
+    "dynamic_programming": DynamicProgrammingSolver,
+    "greedy": GreedyAlgorithmSolver,
+    "constraint_satisfaction": ConstraintSatisfactionSolver
+}
+
+
+@dataclass(slots=True)
+class ExecutionRecord:
+    """One orchestrated execution, kept in the orchestrator's history"""
+    problem: Dict[str, Any]
+    result: AlgorithmResult
+    algorithm_used: str
+    recommendation: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dictionary form returned by get_execution_history"""
+        record = {"problem": self.problem}
+        if self.recommendation is not None:
+            record["recommendation"] = self.recommendation
+        record["result"] = self.result
+        record["algorithm_used"] = self.algorithm_used
+        return record
+
+
+class _LazyAlgorithms(Mapping):
+    """Read-only algorithm mapping that instantiates each entry on first access"""
+    
+    __slots__ = ("_factories", "_instances")
+    
+    def __init__(
+        self,
+        factories: Dict[str, Type[Algorithm]],
+        instances: Dict[str, Algorithm]
+    ):
+        self._factories = factories
+        self._instances = instances
+    
+    def __getitem__(self, key: str) -> Algorithm:
+        algorithm = self._instances.get(key)
+        if algorithm is None:
+            algorithm = self._instances.setdefault(key, self._factories[key]())
+        return algorithm
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._factories
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+    
+    def __len__(self) -> int:
+        return len(self._factories)
+
+
+def _unbuilt_metrics(key: str, algorithm_class: Type[Algorithm]) -> Dict[str, Any]:
+    """
+    Metrics for an algorithm the orchestrator has not instantiated yet,
+    identified by its registry key and the class's default name
+    """
+    return {
+        "algorithm_id": key,
+        "algorithm_name": algorithm_class.DEFAULT_NAME,
+        "executions": 0,
+        "successes": 0,
+        "failures": 0,
+        "success_rate": 0.0,
+        "avg_execution_time_ms": 0.0
+    }
+
+
+# Task keywords recommend_algorithm dispatches on, matched anywhere in the
+# task string in a single scan
+_TASK_KEYWORDS = re.compile(
+    "code|generate|sort|search|constraint|csp|optimize|knapsack|"
+    "permutation|combination|fraction"
+)
+
+# Requirement keys that select a code generator
+_PATTERN_REQUIREMENTS = frozenset({"pattern", "design_pattern"})
+_AST_REQUIREMENTS = frozenset({"ast", "syntax_tree"})
+_TEMPLATE_REQUIREMENTS = frozenset({"template", "boilerplate"})
+
+# Recommendation returned for each algorithm key; None is the fallback
+_RECOMMENDATIONS: Dict[Optional[str], Dict[str, Any]] = {
+    "pattern": {
+        "algorithm": "pattern",
+        "algorithm_name": "Pattern-Based Code Generator",
+        "confidence": 0.95,
+        "reason": "Design pattern specified"
+    },
+    "ast": {
+        "algorithm": "ast",
+        "algorithm_name": "AST-Based Code Generator",
+        "confidence": 0.90,
+        "reason": "AST manipulation required"
+    },
+    "template": {
+        "algorithm": "template",
+        "algorithm_name": "Template-Based Code Generator",
+        "confidence": 0.85,
+        "reason": "Template-based generation"
+    },
+    "ai": {
+        "algorithm": "ai",
+        "algorithm_name": "AI-Assisted Code Generator",
+        "confidence": 0.80,
+        "reason": "AI for flexible generation"
+    },
+    "divide_conquer": {
+        "algorithm": "divide_conquer",
+        "algorithm_name": "Divide and Conquer Solver",
+        "confidence": 0.90,
+        "reason": "Efficient for sorting/searching"
+    },
+    "constraint_satisfaction": {
+        "algorithm": "constraint_satisfaction",
+        "algorithm_name": "Constraint Satisfaction Solver",
+        "confidence": 0.95,
+        "reason": "CSP problem detected"
+    },
+    "greedy": {
+        "algorithm": "greedy",
+        "algorithm_name": "Greedy Algorithm Solver",
+        "confidence": 0.85,
+        "reason": "Fractional optimization"
+    },
+    "dynamic_programming": {
+        "algorithm": "dynamic_programming",
+        "algorithm_name": "Dynamic Programming Solver",
+        "confidence": 0.90,
+        "reason": "Optimization problem"
+    },
+    "backtracking": {
+        "algorithm": "backtracking",
+        "algorithm_name": "Backtracking Solver",
+        "confidence": 0.90,
+        "reason": "Combinatorial problem"
+    },
+    None: {
+        "algorithm": "ai",
+        "algorithm_name": "AI-Assisted Code Generator",
+        "confidence": 0.60,
+        "reason": "General purpose algorithm"
+    },
+}
+
+
 class AlgorithmOrchestrator:
     """
     Orchestrates multiple algorithms for complex problem solving
@@ -48,33 +209,23 @@ class AlgorithmOrchestrator:
         ```
     """
     
-    def __init__(self):
-        """Initialize the orchestrator with all available algorithms"""
-        # Initialize code generation algorithms
-        self.code_generators = {
-            "template": TemplateBasedCodeGenerator(),
-            "ast": ASTBasedCodeGenerator(),
-            "pattern": PatternBasedCodeGenerator(),
-            "ai": AIAssistedCodeGenerator()
-        }
-        
-        # Initialize problem solving algorithms
-        self.problem_solvers = {
-            "divide_conquer": DivideAndConquerSolver(),
-            "backtracking": BacktrackingSolver(),
-            "dynamic_programming": DynamicProgrammingSolver(),
-            "greedy": GreedyAlgorithmSolver(),
-            "constraint_satisfaction": ConstraintSatisfactionSolver()
-        }
+    def __init__(self, max_history: int = 10_000):
+        """
+        Initialize the orchestrator with all available algorithms
         
-        # All algorithms
-        self.all_algorithms = {
-            **self.code_generators,
-            **self.problem_solvers
-        }
+        Args:
+            max_history: Number of most recent executions to keep
+        """
+        # Algorithms are built on first use; the three views share instances
+        instances: Dict[str, Algorithm] = {}
+        self.code_generators = _LazyAlgorithms(_CODE_GENERATORS, instances)
+        self.problem_solvers = _LazyAlgorithms(_PROBLEM_SOLVERS, instances)
+        self.all_algorithms = _LazyAlgorithms(
+            {**_CODE_GENERATORS, **_PROBLEM_SOLVERS}, instances
+        )
         
-        # Execution history
-        self.execution_history: List[Dict[str, Any]] = []
+        # Execution history, oldest records dropped once full
+        self.execution_history: Deque[ExecutionRecord] = deque(maxlen=max_history)
     
     def recommend_algorithm(self, problem: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -89,85 +240,34 @@ class AlgorithmOrchestrator:
         task_type = problem.get("task", "").lower()
         requirements = problem.get("requirements", {})
         
+        keywords = set(_TASK_KEYWORDS.findall(task_type))
+        
         # Code generation recommendations
-        if "code" in task_type or "generate" in task_type:
-            if "pattern" in requirements or "design_pattern" in requirements:
-                return {
-                    "algorithm": "pattern",
-                    "algorithm_name": "Pattern-Based Code Generator",
-                    "confidence": 0.95,
-                    "reason": "Design pattern specified"
-                }
-            elif "ast" in requirements or "syntax_tree" in requirements:
-                return {
-                    "algorithm": "ast",
-                    "algorithm_name": "AST-Based Code Generator",
-                    "confidence": 0.90,
-                    "reason": "AST manipulation required"
-                }
-            elif "template" in requirements or "boilerplate" in requirements:
-                return {
-                    "algorithm": "template",
-                    "algorithm_name": "Template-Based Code Generator",
-                    "confidence": 0.85,
-                    "reason": "Template-based generation"
-                }
+        if not keywords.isdisjoint(("code", "generate")):
+            if not _PATTERN_REQUIREMENTS.isdisjoint(requirements):
+                algorithm_key = "pattern"
+            elif not _AST_REQUIREMENTS.isdisjoint(requirements):
+                algorithm_key = "ast"
+            elif not _TEMPLATE_REQUIREMENTS.isdisjoint(requirements):
+                algorithm_key = "template"
             else:
-                return {
-                    "algorithm": "ai",
-                    "algorithm_name": "AI-Assisted Code Generator",
-                    "confidence": 0.80,
-                    "reason": "AI for flexible generation"
-                }
+                algorithm_key = "ai"
         
         # Problem solving recommendations
-        elif "sort" in task_type or "search" in task_type:
-            return {
-                "algorithm": "divide_conquer",
-                "algorithm_name": "Divide and Conquer Solver",
-                "confidence": 0.90,
-                "reason": "Efficient for sorting/searching"
-            }
-        
-        elif "constraint" in task_type or "csp" in task_type:
-            return {
-                "algorithm": "constraint_satisfaction",
-                "algorithm_name": "Constraint Satisfaction Solver",
-                "confidence": 0.95,
-                "reason": "CSP problem detected"
-            }
-        
-        elif "optimize" in task_type or "knapsack" in task_type:
-            if "fraction" in task_type:
-                return {
-                    "algorithm": "greedy",
-                    "algorithm_name": "Greedy Algorithm Solver",
-                    "confidence": 0.85,
-                    "reason": "Fractional optimization"
-                }
-            else:
-                return {
-                    "algorithm": "dynamic_programming",
-                    "algorithm_name": "Dynamic Programming Solver",
-                    "confidence": 0.90,
-                    "reason": "Optimization problem"
-                }
-        
-        elif "permutation" in task_type or "combination" in task_type:
-            return {
-                "algorithm": "backtracking",
-                "algorithm_name": "Backtracking Solver",
-                "confidence": 0.90,
-                "reason": "Combinatorial problem"
-            }
+        elif not keywords.isdisjoint(("sort", "search")):
+            algorithm_key = "divide_conquer"
+        elif not keywords.isdisjoint(("constraint", "csp")):
+            algorithm_key = "constraint_satisfaction"
+        elif not keywords.isdisjoint(("optimize", "knapsack")):
+            algorithm_key = "greedy" if "fraction" in keywords else "dynamic_programming"
+        elif not keywords.isdisjoint(("permutation", "combination")):
+            algorithm_key = "backtracking"
         
         # Default recommendation
-        return {
-            "algorithm": "ai",
-            "algorithm_name": "AI-Assisted Code Generator",
-            "confidence": 0.60,
-            "reason": "General purpose algorithm"
-        }
+        else:
+            algorithm_key = None
+        
+        return dict(_RECOMMENDATIONS[algorithm_key])
     
     def execute_with_best_algorithm(
         self, 
@@ -192,12 +292,9 @@ class AlgorithmOrchestrator:
         result = algorithm.execute(problem)
         
         # Record execution
-        self.execution_history.append({
-            "problem": problem,
-            "recommendation": recommendation,
-            "result": result,
-            "algorithm_used": algorithm_key
-        })
+        self.execution_history.append(
+            ExecutionRecord(problem, result, algorithm_key, recommendation)
+        )
         
         return result
     
@@ -223,11 +320,7 @@ class AlgorithmOrchestrator:
         result = algorithm.execute(problem)
         
         # Record execution
-        self.execution_history.append({
-            "problem": problem,
-            "result": result,
-            "algorithm_used": algorithm_key
-        })
+        self.execution_history.append(ExecutionRecord(problem, result, algorithm_key))
         
         return result
     
@@ -256,13 +349,18 @@ class AlgorithmOrchestrator:
         return results
     
     def get_algorithm_metrics(self) -> Dict[str, Any]:
-        """Get performance metrics for all algorithms"""
-        metrics = {}
-        
-        for key, algorithm in self.all_algorithms.items():
-            metrics[key] = algorithm.get_metrics()
+        """
+        Get performance metrics for all algorithms
         
-        return metrics
+        Algorithms that have not been built yet report zero counters without
+        being instantiated.
+        """
+        built = self.all_algorithms._instances
+        factories = self.all_algorithms._factories
+        return {
+            key: built[key].get_metrics() if key in built else _unbuilt_metrics(key, factories[key])
+            for key in factories
+        }
     
     def get_execution_history(
         self, 
@@ -277,9 +375,9 @@ class AlgorithmOrchestrator:
         Returns:
             List of execution records
         """
-        if limit:
-            return self.execution_history[-limit:]
-        return self.execution_history
+        records = self.execution_history
+        start = max(len(records) - limit, 0) if limit else 0
+        return [record.to_dict() for record in islice(records, start, None)]
     
     def list_algorithms(self, algorithm_type: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -5,10 +5,16 @@ Explores solution space by trying possibilities and backtracking when
 a path doesn't lead to a solution.
 """
 
+import math
+from itertools import combinations, islice, permutations
 from typing import Dict, Any, List, Set, Callable, Optional
 from ..base import Algorithm, AlgorithmType, AlgorithmStrategy
 
 
+# Maze directions in search order: right, down, left, up
+_MAZE_MOVES = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+
 class BacktrackingSolver(Algorithm):
     """
     Backtracking algorithm solver
@@ -26,9 +32,12 @@ class BacktrackingSolver(Algorithm):
         ```
     """
     
+    DEFAULT_NAME = "Backtracking Solver"
+    REQUIRED_FIELDS = ("problem_type",)
+    
     def __init__(self, **data):
         if "name" not in data:
-            data["name"] = "Backtracking Solver"
+            data["name"] = self.DEFAULT_NAME
         if "type" not in data:
             data["type"] = AlgorithmType.PROBLEM_SOLVING
         if "strategy" not in data:
@@ -38,40 +47,32 @@ class BacktrackingSolver(Algorithm):
         
         super().__init__(**data)
     
-    def _validate_input(self, input_data: Dict[str, Any]) -> None:
-        """Validate input for backtracking"""
-        super()._validate_input(input_data)
-        
-        if "problem_type" not in input_data:
-            raise ValueError("Missing required field: problem_type")
+    # Problem handlers keyed on problem_type, replacing an if/elif chain
+    _PROBLEM_HANDLERS = {
+        "n_queens": lambda self, data: self._solve_n_queens(
+            data.get("n", 8), data.get("collect_all", False)
+        ),
+        "sudoku": lambda self, data: self._solve_sudoku(data.get("board", [])),
+        "subset_sum": lambda self, data: self._solve_subset_sum(
+            data.get("numbers", []), data.get("target", 0), data.get("unique", False)
+        ),
+        "permutations": lambda self, data: self._generate_permutations(data.get("items", [])),
+        "combinations": lambda self, data: self._generate_combinations(
+            data.get("items", []), data.get("k", 2)
+        ),
+        "graph_coloring": lambda self, data: self._solve_graph_coloring(
+            data.get("graph", {}), data.get("colors", 3)
+        ),
+        "maze": lambda self, data: self._solve_maze(data.get("maze", [])),
+    }
     
     def _execute_core(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute backtracking algorithm"""
         problem_type = input_data["problem_type"]
         
-        if problem_type == "n_queens":
-            result = self._solve_n_queens(input_data.get("n", 8))
-        elif problem_type == "sudoku":
-            result = self._solve_sudoku(input_data.get("board", []))
-        elif problem_type == "subset_sum":
-            result = self._solve_subset_sum(
-                input_data.get("numbers", []),
-                input_data.get("target", 0)
-            )
-        elif problem_type == "permutations":
-            result = self._generate_permutations(input_data.get("items", []))
-        elif problem_type == "combinations":
-            result = self._generate_combinations(
-                input_data.get("items", []),
-                input_data.get("k", 2)
-            )
-        elif problem_type == "graph_coloring":
-            result = self._solve_graph_coloring(
-                input_data.get("graph", {}),
-                input_data.get("colors", 3)
-            )
-        elif problem_type == "maze":
-            result = self._solve_maze(input_data.get("maze", []))
+        handler = self._PROBLEM_HANDLERS.get(problem_type)
+        if handler is not None:
+            result = handler(self, input_data)
         else:
             result = {"error": f"Unknown problem type: {problem_type}"}
         
@@ -81,41 +82,75 @@ class BacktrackingSolver(Algorithm):
             "algorithm": "backtracking"
         }
     
-    def _solve_n_queens(self, n: int) -> Dict[str, Any]:
-        """Solve N-Queens problem"""
-        def is_safe(board, row, col):
-            # Check column
-            for i in range(row):
-                if board[i] == col:
-                    return False
-            
-            # Check diagonal
-            for i in range(row):
-                if abs(board[i] - col) == abs(i - row):
-                    return False
-            
-            return True
+    def _solve_n_queens(self, n: int, collect_all: bool = False) -> Dict[str, Any]:
+        """
+        Solve N-Queens problem
+        
+        Only the count and the first solution are kept unless collect_all
+        is set, in which case every placement is listed in lexicographic
+        order under "solutions".
+        """
+        # Attacked columns and diagonals are bitmasks over the current row,
+        # bit i standing for column i; the diagonal masks shift one column
+        # per row so they line up with the next row down
+        all_columns = (1 << n) - 1 if n > 0 else 0
+        placement = [-1] * max(n, 0)
+        solutions_count = 0
+        first_solution = None
+        found = [] if collect_all else None
         
-        def solve(board, row):
+        def solve(row, cols, diag1, diag2):
+            nonlocal solutions_count, first_solution
             if row == n:
-                solutions.append(board[:])
+                solutions_count += 1
+                if first_solution is None:
+                    first_solution = placement[:]
+                if found is not None:
+                    found.append(placement[:])
                 return
             
-            for col in range(n):
-                if is_safe(board, row, col):
-                    board[row] = col
-                    solve(board, row + 1)
-                    board[row] = -1
+            # Lowest bit first, so columns are tried in ascending order
+            free = all_columns & ~(cols | diag1 | diag2)
+            while free:
+                bit = free & -free
+                free ^= bit
+                placement[row] = bit.bit_length() - 1
+                solve(row + 1, cols | bit, (diag1 | bit) << 1, (diag2 | bit) >> 1)
         
-        solutions = []
-        board = [-1] * n
-        solve(board, 0)
+        mirrored = []
+        if n <= 0:
+            solve(0, 0, 0, 0)
+        else:
+            # Mirror symmetry: reflecting a board moves its first queen from
+            # column c to n-1-c, so only the left half of the first row is
+            # searched and those counts doubled; the middle column of an odd
+            # board is its own mirror. The lexicographically first solution
+            # always starts in that half, so first_solution is unaffected.
+            for col in range((n + 1) // 2):
+                found_before = solutions_count
+                listed_before = len(found) if found is not None else 0
+                bit = 1 << col
+                placement[0] = col
+                solve(1, bit, bit << 1, bit >> 1)
+                if col < n // 2:
+                    solutions_count += solutions_count - found_before
+                    if found is not None:
+                        # Reflection reverses the order within a first column
+                        mirrored.append([
+                            [n - 1 - c for c in solution]
+                            for solution in reversed(found[listed_before:])
+                        ])
         
-        return {
-            "solutions_count": len(solutions),
-            "first_solution": solutions[0] if solutions else None,
+        result = {
+            "solutions_count": solutions_count,
+            "first_solution": first_solution,
             "n": n
         }
+        if found is not None:
+            for group in reversed(mirrored):
+                found.extend(group)
+            result["solutions"] = found
+        return result
     
     def _solve_sudoku(self, board: List[List[int]]) -> Dict[str, Any]:
         """Solve Sudoku puzzle"""
@@ -123,106 +158,167 @@ class BacktrackingSolver(Algorithm):
             # Create empty 9x9 board for demo
             board = [[0] * 9 for _ in range(9)]
         
-        def is_valid(board, row, col, num):
-            # Check row
-            if num in board[row]:
-                return False
+        # Digits already used in each row, column and 3x3 box, as 9-bit
+        # masks with bit d-1 standing for digit d
+        row_used = [0] * 9
+        col_used = [0] * 9
+        box_used = [0] * 9
+        empties = []
+        
+        # The search writes digits into one flat buffer indexed 9*row + col
+        # and copies them onto the board once a solution is complete
+        filled = bytearray(81)
+        
+        for i in range(9):
+            for j in range(9):
+                value = board[i][j]
+                if value == 0:
+                    empties.append((9 * i + j, i, j, 3 * (i // 3) + j // 3))
+                elif 1 <= value <= 9:
+                    bit = 1 << (value - 1)
+                    row_used[i] |= bit
+                    col_used[j] |= bit
+                    box_used[3 * (i // 3) + j // 3] |= bit
+        
+        def solve(remaining):
+            # empties[:remaining] are the cells still to fill
+            if remaining == 0:
+                return True
             
-            # Check column
-            if num in [board[i][col] for i in range(9)]:
+            # Minimum remaining values: fill the most constrained cell next
+            best, best_count, best_candidates = 0, 10, 0
+            for k in range(remaining):
+                _, i, j, b = empties[k]
+                candidates = 0x1FF & ~(row_used[i] | col_used[j] | box_used[b])
+                count = candidates.bit_count()
+                if count < best_count:
+                    best, best_count, best_candidates = k, count, candidates
+                    if count <= 1:
+                        break
+            if best_count == 0:
                 return False
             
-            # Check 3x3 box
-            box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-            for i in range(box_row, box_row + 3):
-                for j in range(box_col, box_col + 3):
-                    if board[i][j] == num:
-                        return False
+            last = remaining - 1
+            empties[best], empties[last] = empties[last], empties[best]
+            cell, i, j, b = empties[last]
             
-            return True
-        
-        def solve():
-            for i in range(9):
-                for j in range(9):
-                    if board[i][j] == 0:
-                        for num in range(1, 10):
-                            if is_valid(board, i, j, num):
-                                board[i][j] = num
-                                if solve():
-                                    return True
-                                board[i][j] = 0
-                        return False
-            return True
+            candidates = best_candidates
+            while candidates:
+                bit = candidates & -candidates
+                candidates ^= bit
+                
+                filled[cell] = bit.bit_length()
+                row_used[i] |= bit
+                col_used[j] |= bit
+                box_used[b] |= bit
+                if solve(last):
+                    return True
+                row_used[i] ^= bit
+                col_used[j] ^= bit
+                box_used[b] ^= bit
+            
+            empties[best], empties[last] = empties[last], empties[best]
+            return False
         
-        solved = solve()
+        solved = solve(len(empties))
+        if solved:
+            for cell, i, j, _ in empties:
+                board[i][j] = filled[cell]
         
         return {
             "solved": solved,
             "board": board if solved else None
         }
     
-    def _solve_subset_sum(self, numbers: List[int], target: int) -> Dict[str, Any]:
-        """Find subsets that sum to target"""
-        def backtrack(start, current_sum, path):
-            if current_sum == target:
-                solutions.append(path[:])
-                return
-            
-            if current_sum > target or start >= len(numbers):
-                return
-            
-            for i in range(start, len(numbers)):
-                path.append(numbers[i])
-                backtrack(i + 1, current_sum + numbers[i], path)
-                path.pop()
+    def _solve_subset_sum(
+        self,
+        numbers: List[int],
+        target: int,
+        unique: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Find subsets that sum to target
+        
+        Subsets are told apart by position, so repeated values give
+        repeated solutions, unless unique is set: the numbers are then
+        searched in ascending order and each multiset of values is
+        reported once, as a sorted list.
+        """
+        n = len(numbers)
+        
+        # after[i] is the next candidate once numbers[i] has been tried at
+        # a depth; with unique, equal values are adjacent after sorting and
+        # a value is never tried twice at the same depth
+        after = list(range(1, n + 1))
+        if unique:
+            numbers = sorted(numbers)
+            for i in range(n - 2, -1, -1):
+                if numbers[i] == numbers[i + 1]:
+                    after[i] = after[i + 1]
         
-        solutions = []
-        backtrack(0, 0, [])
+        # reach[i] is the most that numbers[i:] can still add to a sum,
+        # so a branch is cut as soon as even that falls short of target
+        reach = [0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            reach[i] = reach[i + 1] + max(numbers[i], 0)
+        
+        solutions_count = 0
+        solutions = []  # first ten only; the rest are counted
+        
+        if target == 0:
+            solutions_count = 1
+            solutions.append([])
+        elif 0 < target <= reach[0]:
+            # Iterative depth-first search in index order: next_index holds
+            # the next candidate at each depth, partial_sums the running sums
+            path = []
+            next_index = [0]
+            partial_sums = [0]
+            
+            while next_index:
+                i = next_index[-1]
+                if i >= n:
+                    next_index.pop()
+                    partial_sums.pop()
+                    if path:
+                        path.pop()
+                    continue
+                
+                next_index[-1] = after[i]
+                current_sum = partial_sums[-1] + numbers[i]
+                
+                if current_sum == target:
+                    solutions_count += 1
+                    if len(solutions) < 10:
+                        solutions.append(path + [numbers[i]])
+                elif current_sum < target and current_sum + reach[i + 1] >= target:
+                    path.append(numbers[i])
+                    next_index.append(i + 1)
+                    partial_sums.append(current_sum)
         
         return {
-            "solutions_count": len(solutions),
-            "solutions": solutions[:10],  # Limit output
+            "solutions_count": solutions_count,
+            "solutions": solutions,  # Limit output
             "target": target
         }
     
     def _generate_permutations(self, items: List[Any]) -> Dict[str, Any]:
         """Generate all permutations"""
-        def backtrack(path, remaining):
-            if not remaining:
-                results.append(path[:])
-                return
-            
-            for i in range(len(remaining)):
-                path.append(remaining[i])
-                backtrack(path, remaining[:i] + remaining[i+1:])
-                path.pop()
-        
-        results = []
-        backtrack([], items)
-        
+        # itertools yields in the same order as the index-by-index
+        # backtracking; only the returned prefix is materialized
         return {
-            "count": len(results),
-            "permutations": results[:20]  # Limit output
+            "count": math.factorial(len(items)),
+            "permutations": [list(p) for p in islice(permutations(items), 20)]  # Limit output
         }
     
     def _generate_combinations(self, items: List[Any], k: int) -> Dict[str, Any]:
         """Generate all k-combinations"""
-        def backtrack(start, path):
-            if len(path) == k:
-                results.append(path[:])
-                return
-            
-            for i in range(start, len(items)):
-                path.append(items[i])
-                backtrack(i + 1, path)
-                path.pop()
-        
-        results = []
-        backtrack(0, [])
+        if k < 0:
+            return {"count": 0, "combinations": []}
         
         return {
-            "count": len(results),
-            "combinations": results
+            "count": math.comb(len(items), k),
+            "combinations": [list(c) for c in combinations(items, k)]
         }
     
     def _solve_graph_coloring(
@@ -271,32 +367,46 @@ class BacktrackingSolver(Algorithm):
             return {"solvable": False, "path": []}
         
         rows, cols = len(maze), len(maze[0])
+        last_row, last_col = rows - 1, cols - 1
         
-        def solve_maze_recursive(r, c, path, visited):
-            """Recursive helper with explicit state parameters"""
-            if r == rows - 1 and c == cols - 1:
-                path.append((r, c))
-                return True
-            
-            if not (0 <= r < rows and 0 <= c < cols):
-                return False
-            if maze[r][c] == 1 or (r, c) in visited:
-                return False
-            
-            visited.add((r, c))
-            path.append((r, c))
-            
-            # Try all directions: right, down, left, up
-            for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                if solve_maze_recursive(r + dr, c + dc, path, visited):
-                    return True
+        if last_row == 0 and last_col == 0:
+            solvable, path = True, [(0, 0)]
+        elif cols == 0 or maze[0][0] == 1:
+            solvable, path = False, []
+        else:
+            # Iterative depth-first search: path is the stack of open cells
+            # and next_move the direction each one tries next
+            visited = bytearray(rows * cols)
+            visited[0] = 1
+            path = [(0, 0)]
+            next_move = [0]
+            solvable = False
             
-            path.pop()
-            return False
-        
-        path = []
-        visited = set()
-        solvable = solve_maze_recursive(0, 0, path, visited)
+            while path:
+                move = next_move[-1]
+                if move == 4:
+                    path.pop()
+                    next_move.pop()
+                    continue
+                next_move[-1] = move + 1
+                
+                r, c = path[-1]
+                dr, dc = _MAZE_MOVES[move]
+                r += dr
+                c += dc
+                if r == last_row and c == last_col:
+                    path.append((r, c))
+                    solvable = True
+                    break
+                if not (0 <= r < rows and 0 <= c < cols):
+                    continue
+                cell = r * cols + c
+                if maze[r][c] == 1 or visited[cell]:
+                    continue
+                
+                visited[cell] = 1
+                path.append((r, c))
+                next_move.append(0)
         
         return {
             "solvable": solvable,
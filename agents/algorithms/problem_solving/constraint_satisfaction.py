@@ -4,10 +4,105 @@ Constraint Satisfaction Problem Solver
 Solves problems defined by variables, domains, and constraints.
 """
 
-from typing import Dict, Any, List, Set, Callable, Optional
+from bisect import bisect_left
+from collections import deque
+from itertools import permutations
+from typing import Dict, Any, List, Set, Callable, Optional, Iterable, Tuple
 from ..base import Algorithm, AlgorithmType, AlgorithmStrategy
 
 
+_DIGITS = frozenset("0123456789")
+
+
+def _is_numeral_word(word: str) -> bool:
+    """True for a non-empty run of letters and ASCII digits"""
+    return bool(word) and all(char.isalpha() or char in _DIGITS for char in word)
+
+
+def _neighbor_index(
+    variables: List[Any],
+    pairs: Iterable[Tuple[Any, Any]]
+) -> Dict[Any, Dict[Any, None]]:
+    """
+    Map each variable to the other variables it shares a binary
+    constraint with, in first-seen order; endpoints outside variables
+    can never be assigned and are left out
+    """
+    neighbors = {var: {} for var in variables}
+    for var1, var2 in pairs:
+        if var1 != var2 and var1 in neighbors and var2 in neighbors:
+            neighbors[var1][var2] = None
+            neighbors[var2][var1] = None
+    return neighbors
+
+
+def _ac3(
+    neighbors: Dict[Any, Dict[Any, None]],
+    current: Dict[Any, List[Any]]
+) -> bool:
+    """
+    Prune current until every inequality arc is consistent (AC-3)
+    
+    Returns False if a domain empties, in which case no assignment
+    can satisfy the constraints.
+    """
+    queue = deque((var, other) for var in neighbors for other in neighbors[var])
+    queued = set(queue)
+    while queue:
+        arc = queue.popleft()
+        queued.discard(arc)
+        var, other = arc
+        values = current[var]
+        others = current[other]
+        # Under var != other, a value loses its support only when every
+        # value left for other equals it
+        revised = [v for v in values if any(w != v for w in others)]
+        if len(revised) == len(values):
+            continue
+        if not revised:
+            return False
+        current[var] = revised
+        for neighbor in neighbors[var]:
+            if neighbor != other and (neighbor, var) not in queued:
+                queue.append((neighbor, var))
+                queued.add((neighbor, var))
+    return True
+
+
+def _forward_check(
+    neighbors: Dict[Any, Dict[Any, None]],
+    current: Dict[Any, List[Any]],
+    assignment: Dict[Any, Any],
+    var: Any,
+    value: Any
+) -> Optional[List[Tuple[Any, List[Any]]]]:
+    """
+    Remove value from the live domains of var's unassigned neighbors
+    
+    Returns the (neighbor, previous domain) pairs to restore on
+    backtrack, or None, with nothing left pruned, if a domain empties.
+    """
+    pruned = []
+    for neighbor in neighbors[var]:
+        if neighbor in assignment:
+            continue
+        values = current[neighbor]
+        if value in values:
+            pruned.append((neighbor, values))
+            remaining = [v for v in values if v != value]
+            current[neighbor] = remaining
+            if not remaining:
+                _restore(current, pruned)
+                return None
+    return pruned
+
+
+def _restore(current: Dict[Any, List[Any]], pruned: List[Tuple[Any, List[Any]]]) -> None:
+    """Undo the domain reductions made by _forward_check"""
+    for neighbor, values in pruned:
+        current[neighbor] = values
+
+
 class ConstraintSatisfactionSolver(Algorithm):
     """
     Constraint Satisfaction Problem (CSP) solver
@@ -27,9 +122,12 @@ class ConstraintSatisfactionSolver(Algorithm):
         ```
     """
     
+    DEFAULT_NAME = "Constraint Satisfaction Solver"
+    REQUIRED_FIELDS = ("problem_type",)
+    
     def __init__(self, **data):
         if "name" not in data:
-            data["name"] = "Constraint Satisfaction Solver"
+            data["name"] = self.DEFAULT_NAME
         if "type" not in data:
             data["type"] = AlgorithmType.PROBLEM_SOLVING
         if "strategy" not in data:
@@ -39,39 +137,29 @@ class ConstraintSatisfactionSolver(Algorithm):
         
         super().__init__(**data)
     
-    def _validate_input(self, input_data: Dict[str, Any]) -> None:
-        """Validate input for CSP"""
-        super()._validate_input(input_data)
-        
-        if "problem_type" not in input_data:
-            raise ValueError("Missing required field: problem_type")
+    # Problem handlers keyed on problem_type, replacing an if/elif chain
+    _PROBLEM_HANDLERS = {
+        "map_coloring": lambda self, data: self._solve_map_coloring(
+            data.get("variables", []), data.get("domains", {}), data.get("constraints", [])
+        ),
+        "scheduling": lambda self, data: self._solve_scheduling(
+            data.get("tasks", []), data.get("resources", []), data.get("constraints", [])
+        ),
+        "cryptarithmetic": lambda self, data: self._solve_cryptarithmetic(
+            data.get("equation", "")
+        ),
+        "logic_puzzle": lambda self, data: self._solve_logic_puzzle(
+            data.get("variables", []), data.get("domains", {}), data.get("constraints", [])
+        ),
+    }
     
     def _execute_core(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute constraint satisfaction algorithm"""
         problem_type = input_data["problem_type"]
         
-        if problem_type == "map_coloring":
-            result = self._solve_map_coloring(
-                input_data.get("variables", []),
-                input_data.get("domains", {}),
-                input_data.get("constraints", [])
-            )
-        elif problem_type == "scheduling":
-            result = self._solve_scheduling(
-                input_data.get("tasks", []),
-                input_data.get("resources", []),
-                input_data.get("constraints", [])
-            )
-        elif problem_type == "cryptarithmetic":
-            result = self._solve_cryptarithmetic(
-                input_data.get("equation", "")
-            )
-        elif problem_type == "logic_puzzle":
-            result = self._solve_logic_puzzle(
-                input_data.get("variables", []),
-                input_data.get("domains", {}),
-                input_data.get("constraints", [])
-            )
+        handler = self._PROBLEM_HANDLERS.get(problem_type)
+        if handler is not None:
+            result = handler(self, input_data)
         else:
             result = self._generic_csp(
                 input_data.get("variables", []),
@@ -97,11 +185,15 @@ class ConstraintSatisfactionSolver(Algorithm):
         
         assignment = {}
         
+        # Forward checking: current holds each variable's values that are
+        # still consistent with the assignment so far
+        neighbors = _neighbor_index(variables, ((c[0], c[1]) for c in constraints))
+        current = {var: list(domains.get(var, [])) for var in neighbors}
+        
         def is_consistent(var, value):
-            for neighbor in [c[1] for c in constraints if c[0] == var]:
-                if neighbor in assignment and assignment[neighbor] == value:
-                    return False
-            for neighbor in [c[0] for c in constraints if c[1] == var]:
+            # Only endpoints in variables can ever be assigned, so the
+            # neighbor index covers every constraint that can conflict
+            for neighbor in neighbors[var]:
                 if neighbor in assignment and assignment[neighbor] == value:
                     return False
             return True
@@ -117,12 +209,16 @@ class ConstraintSatisfactionSolver(Algorithm):
             
             var = unassigned[0]
             
-            for value in domains.get(var, []):
+            for value in current[var]:
                 if is_consistent(var, value):
+                    pruned = _forward_check(neighbors, current, assignment, var, value)
+                    if pruned is None:
+                        continue
                     assignment[var] = value
                     if backtrack():
                         return True
                     del assignment[var]
+                    _restore(current, pruned)
             
             return False
         
@@ -147,44 +243,38 @@ class ConstraintSatisfactionSolver(Algorithm):
         # Variables: tasks, Domains: time slots and resources
         schedule = {}
         
-        def conflicts(task1, time1, res1, task2, time2, res2):
-            # Same resource at overlapping times
-            if res1 == res2:
-                duration1 = task1.get("duration", 1)
-                duration2 = task2.get("duration", 1)
-                if not (time1 + duration1 <= time2 or time2 + duration2 <= time1):
-                    return True
-            return False
+        # "before" constraints indexed by the task they restrict
+        before_map: Dict[Any, List[Any]] = {}
+        for constraint in constraints:
+            if constraint.get("type") == "before":
+                before_map.setdefault(constraint.get("task1"), []).append(constraint.get("task2"))
+        
+        # Busy (start, end) intervals per resource, sorted by start; the
+        # stored intervals never overlap, so only the one starting last
+        # before a candidate ends can overlap it
+        resource_intervals: Dict[str, List[Tuple[int, int]]] = {
+            resource: [] for resource in resources
+        }
         
         def is_valid(task_id, time, resource):
-            task = tasks[task_id]
+            end = time + tasks[task_id].get("duration", 1)
             
             # Check constraints
-            for constraint in constraints:
-                if constraint.get("type") == "before":
-                    if (constraint.get("task1") == task_id and 
-                        constraint.get("task2") in schedule):
-                        other_time = schedule[constraint["task2"]]["time"]
-                        if time + task.get("duration", 1) > other_time:
-                            return False
-            
-            # Check resource conflicts
-            for other_id, other_schedule in schedule.items():
-                if conflicts(
-                    task, time, resource,
-                    tasks[other_id],
-                    other_schedule["time"],
-                    other_schedule["resource"]
-                ):
+            for other_id in before_map.get(task_id, ()):
+                if other_id in schedule and end > schedule[other_id]["time"]:
                     return False
             
-            return True
+            # Check resource conflicts
+            intervals = resource_intervals[resource]
+            idx = bisect_left(intervals, (end,))
+            return idx == 0 or intervals[idx - 1][1] <= time
         
         def backtrack(task_idx):
             if task_idx >= len(tasks):
                 return True
             
             task = tasks[task_idx]
+            duration = task.get("duration", 1)
             max_time = 20  # Arbitrary time horizon
             
             for time in range(max_time):
@@ -195,10 +285,15 @@ class ConstraintSatisfactionSolver(Algorithm):
                             "time": time,
                             "resource": resource
                         }
+                        intervals = resource_intervals[resource]
+                        interval = (time, time + duration)
+                        position = bisect_left(intervals, interval)
+                        intervals.insert(position, interval)
                         
                         if backtrack(task_idx + 1):
                             return True
                         
+                        intervals.pop(position)
                         del schedule[task_idx]
             
             return False
@@ -269,21 +364,27 @@ class ConstraintSatisfactionSolver(Algorithm):
         if len(letters) > 10:
             return {"solution": None, "error": "Too many unique letters"}
         
-        # Try all digit assignments
-        from itertools import permutations
+        # Sums of plain words are checked with integer arithmetic; anything
+        # else goes through the general expression evaluator below
+        addends = parts[0].split("+")
+        if len(addends) > 1 and all(map(_is_numeral_word, addends)) and _is_numeral_word(parts[1]):
+            return self._solve_word_sum(equation, letters, addends, parts[1])
+        
+        # Positions in letters of the letters that lead a word, which
+        # must not be zero
+        first_letters = {
+            word[0] for word in addends + [parts[1]] if word and word[0].isalpha()
+        }
+        first_indices = [i for i, letter in enumerate(letters) if letter in first_letters]
         
+        # Try all digit assignments
         for perm in permutations(range(10), len(letters)):
-            mapping = dict(zip(letters, perm))
-            
             # Check if first letters are not zero
-            first_letters = set()
-            for word in parts[0].split("+") + [parts[1]]:
-                if word and word[0].isalpha():
-                    first_letters.add(word[0])
-            
-            if any(mapping[letter] == 0 for letter in first_letters):
+            if any(perm[i] == 0 for i in first_indices):
                 continue
             
+            mapping = dict(zip(letters, perm))
+            
             # Evaluate equation
             try:
                 left_side = parts[0]
@@ -318,6 +419,79 @@ class ConstraintSatisfactionSolver(Algorithm):
             "equation": equation
         }
     
+    def _solve_word_sum(
+        self,
+        equation: str,
+        letters: List[str],
+        addends: List[str],
+        total: str
+    ) -> Dict[str, Any]:
+        """
+        Solve WORD + WORD + ... = WORD column by column
+        
+        Works from the units column up, carrying as in long addition. Each
+        column's addend letters are branched on, after which its total digit
+        is forced to the column sum mod 10, so a branch dies at the first
+        column that cannot add up.
+        """
+        index = {letter: i for i, letter in enumerate(letters)}
+        leading = {index[word[0]] for word in addends + [total] if word[0] in index}
+        width = max(len(word) for word in addends + [total])
+        
+        # Column k holds the k-th characters from the right; a total
+        # shorter than the addends reads as leading zeros
+        columns = [
+            (
+                [word[-1 - k] for word in addends if k < len(word)],
+                total[-1 - k] if k < len(total) else "0"
+            )
+            for k in range(width)
+        ]
+        
+        values = [-1] * len(letters)
+        used = 0  # bitmask of assigned digits
+        
+        def value_of(char):
+            return values[index[char]] if char in index else int(char)
+        
+        def assign(i, digit, k, carry):
+            nonlocal used
+            if used >> digit & 1 or (digit == 0 and i in leading):
+                return False
+            values[i] = digit
+            used |= 1 << digit
+            if solve_column(k, carry):
+                return True
+            values[i] = -1
+            used ^= 1 << digit
+            return False
+        
+        def solve_column(k, carry):
+            if k == width:
+                return carry == 0
+            
+            terms, total_char = columns[k]
+            for char in terms:
+                if char in index and values[index[char]] < 0:
+                    i = index[char]
+                    return any(assign(i, digit, k, carry) for digit in range(10))
+            
+            column_sum = carry + sum(value_of(char) for char in terms)
+            digit = column_sum % 10
+            if total_char in index and values[index[total_char]] < 0:
+                return assign(index[total_char], digit, k + 1, column_sum // 10)
+            if value_of(total_char) != digit:
+                return False
+            return solve_column(k + 1, column_sum // 10)
+        
+        satisfied = solve_column(0, 0)
+        
+        return {
+            "solution": dict(zip(letters, values)) if satisfied else None,
+            "satisfied": satisfied,
+            "equation": equation
+        }
+    
     def _solve_logic_puzzle(
         self,
         variables: List[str],
@@ -339,19 +513,48 @@ class ConstraintSatisfactionSolver(Algorithm):
         
         assignment = {}
         
-        def is_consistent(var, value):
-            # Check all constraints
-            for constraint in constraints:
-                if isinstance(constraint, tuple) and len(constraint) == 2:
-                    # Binary constraint
-                    var1, var2 = constraint
-                    if var == var1 and var2 in assignment:
-                        if value == assignment[var2]:
-                            return False
-                    elif var == var2 and var1 in assignment:
-                        if value == assignment[var1]:
-                            return False
-            return True
+        # Forward checking: current holds each variable's values that are
+        # still consistent with the assignment so far
+        neighbors = _neighbor_index(
+            variables,
+            (c for c in constraints if isinstance(c, tuple) and len(c) == 2)
+        )
+        current = {var: list(domains.get(var, [])) for var in neighbors}
+        
+        # Arc consistency up front prunes values no solution can use and
+        # settles some infeasible problems without any search
+        if not all(current.values()) or not _ac3(neighbors, current):
+            return {
+                "solution": None,
+                "satisfied": False,
+                "variables_assigned": 0,
+                "total_variables": len(variables)
+            }
+        
+        # Conflict-directed backjumping: conflicts[var] collects the assigned
+        # variables that ruled out values of var, pruned_by[var] the ones
+        # whose forward checks shrank its domain, and depth the assignment
+        # order used to pick the deepest culprit of a dead end
+        conflicts = {var: set() for var in neighbors}
+        pruned_by = {var: [] for var in neighbors}
+        depth = {}
+        unsatisfiable = object()
+        
+        def conflicting_variable(var, value):
+            # Binary constraints come from the neighbor index built above,
+            # in constraint order; returns the assigned variable whose
+            # value clashes, or None
+            for neighbor in neighbors[var]:
+                if neighbor in assignment and value == assignment[neighbor]:
+                    return neighbor
+            return None
+        
+        def wiped_out_neighbor(var, value):
+            # The unassigned neighbor whose live domain holds only value
+            for neighbor in neighbors[var]:
+                if neighbor not in assignment and all(v == value for v in current[neighbor]):
+                    return neighbor
+            return None
         
         def select_unassigned_variable():
             # Use MRV heuristic (Minimum Remaining Values)
@@ -359,39 +562,60 @@ class ConstraintSatisfactionSolver(Algorithm):
             if not unassigned:
                 return None
             
-            # Count remaining valid values for each variable
-            min_values = float('inf')
-            best_var = unassigned[0]
-            
-            for var in unassigned:
-                valid_count = sum(
-                    1 for val in domains.get(var, [])
-                    if is_consistent(var, val)
-                )
-                if valid_count < min_values:
-                    min_values = valid_count
-                    best_var = var
-            
-            return best_var
+            # Forward checking keeps current[var] to exactly the values still
+            # consistent, so its length is the remaining-values count; min
+            # keeps the first variable on ties
+            return min(unassigned, key=lambda var: len(current[var]))
         
         def backtrack():
+            # Returns None once solved, otherwise the variable to resume
+            # from, skipping every assignment in between
             if len(assignment) == len(variables):
-                return True
+                return None
             
             var = select_unassigned_variable()
             if var is None:
-                return False
+                return unsatisfiable
             
-            for value in domains.get(var, []):
-                if is_consistent(var, value):
-                    assignment[var] = value
-                    if backtrack():
-                        return True
-                    del assignment[var]
+            conflict_set = conflicts[var] = set()
+            for value in current[var]:
+                culprit = conflicting_variable(var, value)
+                if culprit is not None:
+                    conflict_set.add(culprit)
+                    continue
+                pruned = _forward_check(neighbors, current, assignment, var, value)
+                if pruned is None:
+                    conflict_set.update(pruned_by[wiped_out_neighbor(var, value)])
+                    continue
+                
+                assignment[var] = value
+                depth[var] = len(depth)
+                for neighbor, _ in pruned:
+                    pruned_by[neighbor].append(var)
+                
+                target = backtrack()
+                if target is None:
+                    return None
+                
+                for neighbor, _ in pruned:
+                    pruned_by[neighbor].pop()
+                del depth[var]
+                del assignment[var]
+                _restore(current, pruned)
+                if target != var:
+                    return target
             
-            return False
+            # Dead end: jump back to the most recent variable implicated in
+            # it, handing over the rest of the explanation
+            conflict_set.update(pruned_by[var])
+            if not conflict_set:
+                return unsatisfiable
+            target = max(conflict_set, key=depth.__getitem__)
+            conflicts[target].update(conflict_set)
+            conflicts[target].discard(target)
+            return target
         
-        satisfied = backtrack()
+        satisfied = backtrack() is None
         
         return {
             "solution": assignment if satisfied else None,
@@ -5,10 +5,230 @@ Solves problems by breaking them into overlapping subproblems and
 storing solutions to avoid recomputation.
 """
 
-from typing import Dict, Any, List
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, Any, List, Sequence, Tuple
 from ..base import Algorithm, AlgorithmType, AlgorithmStrategy
 
 
+def _are_strings(str1: Any, str2: Any) -> bool:
+    """True when both sequences are str, and so usable as cache keys"""
+    return isinstance(str1, str) and isinstance(str2, str)
+
+
+def _is_totally_ordered_numbers(values: Sequence[Any]) -> bool:
+    """True when every value is a plain int or a non-NaN float"""
+    return all(
+        type(value) is int or (type(value) is float and value == value)
+        for value in values
+    )
+
+
+def _patience_lis(sequence: Sequence[Any]) -> List[Any]:
+    """
+    Longest strictly increasing subsequence in O(n log n), choosing the same
+    subsequence as the quadratic DP: it ends at the first index reaching the
+    maximum length, and each element links to the earliest valid predecessor
+    """
+    tails = []
+    # levels[k] holds the negated values and the indices of the elements whose
+    # longest run ending there has length k + 1, in index order; the values
+    # there never increase, so the negated values can be bisected
+    level_values = []
+    level_indices = []
+    parent = [-1] * len(sequence)
+    
+    for i, x in enumerate(sequence):
+        pos = bisect_left(tails, x)
+        if pos == len(tails):
+            tails.append(x)
+            level_values.append([])
+            level_indices.append([])
+        else:
+            tails[pos] = x
+        if pos:
+            # Earliest element one level down that is smaller than x
+            below = bisect_right(level_values[pos - 1], -x)
+            parent[i] = level_indices[pos - 1][below]
+        level_values[pos].append(-x)
+        level_indices[pos].append(i)
+    
+    lis = []
+    idx = level_indices[-1][0]
+    while idx != -1:
+        lis.append(sequence[idx])
+        idx = parent[idx]
+    lis.reverse()
+    return lis
+
+
+def _bit_parallel_lcs(str1: str, str2: str) -> Tuple[int, str]:
+    """
+    LCS of two strings by Hyyro's bit-parallel recurrence: bit i of each
+    column vector covers str1[i], so a whole column updates with a few
+    big-int operations; dp[i][j] is i minus the set bits among the low i
+    bits of column j, which drives the same traceback as the full table
+    """
+    m = len(str1)
+    full = (1 << m) - 1
+    positions = {}
+    for i, char in enumerate(str1):
+        positions[char] = positions.get(char, 0) | (1 << i)
+    
+    columns = [full]
+    v = full
+    for char in str2:
+        u = v & positions.get(char, 0)
+        v = ((v + u) | (v - u)) & full
+        columns.append(v)
+    
+    def dp(i: int, j: int) -> int:
+        return i - (columns[j] & ((1 << i) - 1)).bit_count()
+    
+    # Reconstruct LCS
+    lcs = []
+    i, j = m, len(str2)
+    while i > 0 and j > 0:
+        if str1[i-1] == str2[j-1]:
+            lcs.append(str1[i-1])
+            i -= 1
+            j -= 1
+        elif dp(i - 1, j) > dp(i, j - 1):
+            i -= 1
+        else:
+            j -= 1
+    
+    lcs.reverse()
+    
+    return m - columns[-1].bit_count(), "".join(lcs)
+
+
+def _longest_common_subsequence(str1: Sequence[Any], str2: Sequence[Any]) -> Tuple[int, str]:
+    """LCS length and the subsequence traced back from the DP table"""
+    if _are_strings(str1, str2):
+        return _bit_parallel_lcs(str1, str2)
+    
+    # Other sequences may hold unhashable items, so they keep the table
+    m, n = len(str1), len(str2)
+    dp = [[0] * (n + 1)]
+    
+    # Each row is built left to right from the row above; left, up and
+    # diag are dp[i][j-1], dp[i-1][j] and dp[i-1][j-1] kept in locals
+    prev = dp[0]
+    for char1 in str1:
+        left = diag = 0
+        row = [0]
+        append = row.append
+        for char2, up in zip(str2, prev[1:]):
+            if char1 == char2:
+                left = diag + 1
+            elif up > left:
+                left = up
+            append(left)
+            diag = up
+        dp.append(row)
+        prev = row
+    
+    # Reconstruct LCS
+    lcs = []
+    i, j = m, n
+    while i > 0 and j > 0:
+        if str1[i-1] == str2[j-1]:
+            lcs.append(str1[i-1])
+            i -= 1
+            j -= 1
+        elif dp[i-1][j] > dp[i][j-1]:
+            i -= 1
+        else:
+            j -= 1
+    
+    lcs.reverse()
+    
+    return dp[m][n], "".join(lcs)
+
+
+def _last_edit_row(str1: Sequence[Any], str2: Sequence[Any]) -> List[int]:
+    """
+    Last row of the edit-distance table: the distance from all of str1 to
+    each prefix of str2, built keeping only the previous row
+    """
+    # Initialize base cases
+    prev = list(range(len(str2) + 1))
+    
+    # Fill DP table row by row, with left, up and diag holding
+    # dp[i][j-1], dp[i-1][j] and dp[i-1][j-1]
+    for i, char1 in enumerate(str1, 1):
+        left, diag = i, i - 1
+        row = [i]
+        append = row.append
+        for char2, up in zip(str2, prev[1:]):
+            if char1 == char2:
+                left = diag
+            else:
+                # 1 + min(delete, insert, replace)
+                if up < left:
+                    left = up
+                if diag < left:
+                    left = diag
+                left += 1
+            append(left)
+            diag = up
+        prev = row
+    
+    return prev
+
+
+def _levenshtein_distance(str1: Sequence[Any], str2: Sequence[Any]) -> int:
+    """Edit distance with unit costs"""
+    # The distance is symmetric, so the shorter string runs along the
+    # rows; only the previous row is kept, O(min(m, n)) memory
+    outer, inner = (str1, str2) if len(str1) >= len(str2) else (str2, str1)
+    return _last_edit_row(outer, inner)[-1]
+
+
+def _edit_operations(str1: Sequence[Any], str2: Sequence[Any]) -> List[Tuple[str, Any, Any]]:
+    """
+    A minimal alignment of str1 onto str2 as (operation, char1, char2)
+    steps, found with Hirschberg's recursion in O(m + n) memory: the
+    middle row of str1 is split where the forward and reverse distances
+    sum to the least, and each half is aligned on its own
+    """
+    m, n = len(str1), len(str2)
+    if m == 0:
+        return [("insert", None, char2) for char2 in str2]
+    if n == 0:
+        return [("delete", char1, None) for char1 in str1]
+    
+    if m == 1:
+        char1 = str1[0]
+        for j, char2 in enumerate(str2):
+            if char1 == char2:
+                break
+        else:
+            j = 0
+        operation = "match" if char1 == str2[j] else "replace"
+        return (
+            [("insert", None, char2) for char2 in str2[:j]]
+            + [(operation, char1, str2[j])]
+            + [("insert", None, char2) for char2 in str2[j + 1:]]
+        )
+    
+    mid = m // 2
+    forward = _last_edit_row(str1[:mid], str2)
+    reverse = _last_edit_row(str1[mid:][::-1], str2[::-1])
+    split = min(range(n + 1), key=lambda j: forward[j] + reverse[n - j])
+    
+    return (
+        _edit_operations(str1[:mid], str2[:split])
+        + _edit_operations(str1[mid:], str2[split:])
+    )
+
+
+# Results for recently seen string pairs, shared by all solver instances
+_cached_lcs = lru_cache(maxsize=256)(_longest_common_subsequence)
+_cached_edit_distance = lru_cache(maxsize=1024)(_levenshtein_distance)
+
+
 class DynamicProgrammingSolver(Algorithm):
     """
     Dynamic Programming algorithm solver
@@ -26,9 +246,12 @@ class DynamicProgrammingSolver(Algorithm):
         ```
     """
     
+    DEFAULT_NAME = "Dynamic Programming Solver"
+    REQUIRED_FIELDS = ("problem_type",)
+    
     def __init__(self, **data):
         if "name" not in data:
-            data["name"] = "Dynamic Programming Solver"
+            data["name"] = self.DEFAULT_NAME
         if "type" not in data:
             data["type"] = AlgorithmType.PROBLEM_SOLVING
         if "strategy" not in data:
@@ -38,43 +261,37 @@ class DynamicProgrammingSolver(Algorithm):
         
         super().__init__(**data)
     
-    def _validate_input(self, input_data: Dict[str, Any]) -> None:
-        """Validate input for dynamic programming"""
-        super()._validate_input(input_data)
-        
-        if "problem_type" not in input_data:
-            raise ValueError("Missing required field: problem_type")
+    # Problem handlers keyed on problem_type, replacing an if/elif chain
+    _PROBLEM_HANDLERS = {
+        "fibonacci": lambda self, data: self._fibonacci(data.get("n", 10)),
+        "knapsack": lambda self, data: self._knapsack(
+            data.get("items", []), data.get("capacity", 0)
+        ),
+        "longest_common_subsequence": lambda self, data: self._lcs(
+            data.get("str1", ""), data.get("str2", "")
+        ),
+        "edit_distance": lambda self, data: self._edit_distance(
+            data.get("str1", ""), data.get("str2", ""),
+            data.get("include_operations", False)
+        ),
+        "coin_change": lambda self, data: self._coin_change(
+            data.get("coins", []), data.get("amount", 0)
+        ),
+        "longest_increasing_subsequence": lambda self, data: self._lis(
+            data.get("sequence", [])
+        ),
+        "matrix_chain_multiplication": lambda self, data: self._matrix_chain(
+            data.get("dimensions", [])
+        ),
+    }
     
     def _execute_core(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute dynamic programming algorithm"""
         problem_type = input_data["problem_type"]
         
-        if problem_type == "fibonacci":
-            result = self._fibonacci(input_data.get("n", 10))
-        elif problem_type == "knapsack":
-            result = self._knapsack(
-                input_data.get("items", []),
-                input_data.get("capacity", 0)
-            )
-        elif problem_type == "longest_common_subsequence":
-            result = self._lcs(
-                input_data.get("str1", ""),
-                input_data.get("str2", "")
-            )
-        elif problem_type == "edit_distance":
-            result = self._edit_distance(
-                input_data.get("str1", ""),
-                input_data.get("str2", "")
-            )
-        elif problem_type == "coin_change":
-            result = self._coin_change(
-                input_data.get("coins", []),
-                input_data.get("amount", 0)
-            )
-        elif problem_type == "longest_increasing_subsequence":
-            result = self._lis(input_data.get("sequence", []))
-        elif problem_type == "matrix_chain_multiplication":
-            result = self._matrix_chain(input_data.get("dimensions", []))
+        handler = self._PROBLEM_HANDLERS.get(problem_type)
+        if handler is not None:
+            result = handler(self, input_data)
         else:
             result = {"error": f"Unknown problem type: {problem_type}"}
         
@@ -92,16 +309,23 @@ class DynamicProgrammingSolver(Algorithm):
         if n <= 1:
             return {"value": n, "n": n}
         
-        dp = [0] * (n + 1)
-        dp[1] = 1
-        
-        for i in range(2, n + 1):
-            dp[i] = dp[i-1] + dp[i-2]
+        # Only the last two values are needed: a, b = F(i), F(i+1)
+        a, b = 0, 1
+        if n <= 1000:
+            for _ in range(n):
+                a, b = b, a + b
+        else:
+            # Fast doubling, one bit of n at a time from the top:
+            # F(2i) = F(i)(2F(i+1) - F(i)), F(2i+1) = F(i)² + F(i+1)²
+            for bit in bin(n)[2:]:
+                a, b = a * (2 * b - a), a * a + b * b
+                if bit == "1":
+                    a, b = b, a + b
         
         return {
-            "value": dp[n],
+            "value": a,
             "n": n,
-            "computed_values": len(dp)
+            "computed_values": n + 1
         }
     
     def _knapsack(self, items: List[Dict[str, int]], capacity: int) -> Dict[str, Any]:
@@ -110,21 +334,32 @@ class DynamicProgrammingSolver(Algorithm):
             return {"max_value": 0, "items": []}
         
         n = len(items)
-        dp = [[0] * (capacity + 1) for _ in range(n + 1)]
-        
-        # Build DP table
-        for i in range(1, n + 1):
-            weight = items[i-1]["weight"]
-            value = items[i-1]["value"]
+        dp = [[0] * (capacity + 1)]
+        # Weights are kept in their own list for the backtrack, so each
+        # item's dict is read once
+        weights = []
+        
+        # Build DP table a whole row at a time: capacities below the item's
+        # weight copy the row above, the rest take the better of skipping
+        # the item or adding it to the row above shifted by its weight
+        for item in items:
+            weight = item["weight"]
+            value = item["value"]
+            weights.append(weight)
+            prev = dp[-1]
             
-            for w in range(capacity + 1):
-                if weight <= w:
-                    dp[i][w] = max(
-                        dp[i-1][w],
-                        dp[i-1][w-weight] + value
-                    )
-                else:
-                    dp[i][w] = dp[i-1][w]
+            if weight > capacity:
+                dp.append(prev[:])
+                continue
+            if weight < 0:
+                raise ValueError("Item weights must be non-negative")
+            
+            # zip stops at the end of prev[weight:], pairing each capacity
+            # with the one weight below it
+            dp.append(prev[:weight] + [
+                taken if (taken := below + value) > skipped else skipped
+                for skipped, below in zip(prev[weight:], prev)
+            ])
         
         # Backtrack to find items
         selected_items = []
@@ -132,73 +367,56 @@ class DynamicProgrammingSolver(Algorithm):
         for i in range(n, 0, -1):
             if dp[i][w] != dp[i-1][w]:
                 selected_items.append(i-1)
-                w -= items[i-1]["weight"]
+                w -= weights[i-1]
         
         return {
             "max_value": dp[n][capacity],
             "selected_items": selected_items,
-            "total_weight": sum(items[i]["weight"] for i in selected_items)
+            "total_weight": sum(weights[i] for i in selected_items)
         }
     
     def _lcs(self, str1: str, str2: str) -> Dict[str, Any]:
         """Longest Common Subsequence"""
         m, n = len(str1), len(str2)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-        
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if str1[i-1] == str2[j-1]:
-                    dp[i][j] = dp[i-1][j-1] + 1
-                else:
-                    dp[i][j] = max(dp[i-1][j], dp[i][j-1])
-        
-        # Reconstruct LCS
-        lcs = []
-        i, j = m, n
-        while i > 0 and j > 0:
-            if str1[i-1] == str2[j-1]:
-                lcs.append(str1[i-1])
-                i -= 1
-                j -= 1
-            elif dp[i-1][j] > dp[i][j-1]:
-                i -= 1
-            else:
-                j -= 1
         
-        lcs.reverse()
+        # Strings are hashable, so repeated pairs are served from the cache
+        compute = _cached_lcs if _are_strings(str1, str2) else _longest_common_subsequence
+        length, subsequence = compute(str1, str2)
         
         return {
-            "length": dp[m][n],
-            "subsequence": "".join(lcs),
+            "length": length,
+            "subsequence": subsequence,
             "str1_length": m,
             "str2_length": n
         }
     
-    def _edit_distance(self, str1: str, str2: str) -> Dict[str, Any]:
-        """Edit Distance (Levenshtein distance)"""
-        m, n = len(str1), len(str2)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-        
-        # Initialize base cases
-        for i in range(m + 1):
-            dp[i][0] = i
-        for j in range(n + 1):
-            dp[0][j] = j
-        
-        # Fill DP table
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if str1[i-1] == str2[j-1]:
-                    dp[i][j] = dp[i-1][j-1]
-                else:
-                    dp[i][j] = 1 + min(
-                        dp[i-1][j],      # Delete
-                        dp[i][j-1],      # Insert
-                        dp[i-1][j-1]     # Replace
-                    )
+    def _edit_distance(
+        self,
+        str1: str,
+        str2: str,
+        include_operations: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Edit distance (Levenshtein distance)
+        
+        With include_operations, the result also lists a minimal alignment
+        as (operation, char1, char2) steps, operation being one of "match",
+        "replace", "insert" or "delete".
+        """
+        if include_operations:
+            operations = _edit_operations(str1, str2)
+            return {
+                "distance": sum(step[0] != "match" for step in operations),
+                "operations": operations,
+                "str1": str1,
+                "str2": str2
+            }
+        
+        # Strings are hashable, so repeated pairs are served from the cache
+        compute = _cached_edit_distance if _are_strings(str1, str2) else _levenshtein_distance
         
         return {
-            "distance": dp[m][n],
+            "distance": compute(str1, str2),
             "str1": str1,
             "str2": str2
         }
@@ -211,17 +429,32 @@ class DynamicProgrammingSolver(Algorithm):
         if not coins:
             return {"min_coins": -1, "coins_used": []}
         
-        dp = [float('inf')] * (amount + 1)
+        inf = float('inf')
+        dp = [inf] * (amount + 1)
         dp[0] = 0
         parent = [-1] * (amount + 1)
         
+        # Only coins that fit are scanned; the list is rebuilt (in input order,
+        # so ties still go to the first coin) each time a new coin starts to fit
+        distinct = list(dict.fromkeys(coins))
+        thresholds = sorted(coin for coin in distinct if coin > 0)
+        usable = [coin for coin in distinct if coin <= 0]
+        t = 0
         for i in range(1, amount + 1):
-            for coin in coins:
-                if coin <= i and dp[i - coin] + 1 < dp[i]:
-                    dp[i] = dp[i - coin] + 1
-                    parent[i] = coin
-        
-        if dp[amount] == float('inf'):
+            if t < len(thresholds) and thresholds[t] <= i:
+                while t < len(thresholds) and thresholds[t] <= i:
+                    t += 1
+                usable = [coin for coin in distinct if coin <= i]
+            best = inf
+            for coin in usable:
+                if dp[i - coin] < best:
+                    best = dp[i - coin]
+                    pick = coin
+            if best != inf:
+                dp[i] = best + 1
+                parent[i] = pick
+        
+        if dp[amount] == inf:
             return {"min_coins": -1, "coins_used": []}
         
         # Reconstruct solution
@@ -244,18 +477,29 @@ class DynamicProgrammingSolver(Algorithm):
             return {"length": 0, "subsequence": []}
         
         n = len(sequence)
+        if _is_totally_ordered_numbers(sequence):
+            lis = _patience_lis(sequence)
+            return {
+                "length": len(lis),
+                "subsequence": lis,
+                "original_length": n
+            }
+        
+        # Other values keep the quadratic DP, which needs no total order
         dp = [1] * n
         parent = [-1] * n
         
+        # The longest run so far and the first index reaching it are
+        # tracked during the fill, instead of rescanning dp afterwards
+        max_length, max_idx = 1, 0
         for i in range(1, n):
+            x = sequence[i]
             for j in range(i):
-                if sequence[j] < sequence[i] and dp[j] + 1 > dp[i]:
+                if sequence[j] < x and dp[j] + 1 > dp[i]:
                     dp[i] = dp[j] + 1
                     parent[i] = j
-        
-        # Find max length and its index
-        max_length = max(dp)
-        max_idx = dp.index(max_length)
+            if dp[i] > max_length:
+                max_length, max_idx = dp[i], i
         
         # Reconstruct subsequence
         lis = []
@@ -279,16 +523,23 @@ class DynamicProgrammingSolver(Algorithm):
         n = len(dimensions) - 1
         dp = [[0] * n for _ in range(n)]
         
+        # by_end[j][i] mirrors dp[i][j], so both operands of the split loop
+        # below, dp[i][k] and dp[k+1][j], are contiguous slices
+        by_end = [[0] * n for _ in range(n)]
+        
         # l is chain length
         for l in range(2, n + 1):
             for i in range(n - l + 1):
                 j = i + l - 1
-                dp[i][j] = float('inf')
+                rows, columns = dimensions[i], dimensions[j+1]
                 
-                for k in range(i, j):
-                    cost = (dp[i][k] + dp[k+1][j] + 
-                           dimensions[i] * dimensions[k+1] * dimensions[j+1])
-                    dp[i][j] = min(dp[i][j], cost)
+                # Split after matrix k, for k from i to j - 1
+                dp[i][j] = by_end[j][i] = min([
+                    left + right + rows * inner * columns
+                    for left, right, inner in zip(
+                        dp[i][i:j], by_end[j][i+1:j+1], dimensions[i+1:j+1]
+                    )
+                ])
         
         return {
             "min_operations": dp[0][n-1] if n > 0 else 0,
@@ -4,11 +4,28 @@ Greedy Algorithm Solver
 Makes locally optimal choices at each step to find a global solution.
 """
 
+from operator import itemgetter
 from typing import Dict, Any, List, Tuple
 import heapq
+import math
 from ..base import Algorithm, AlgorithmType, AlgorithmStrategy
 
 
+def _has_finite_sums(values: List[Any]) -> bool:
+    """
+    True for plain ints, or plain numbers whose absolute values sum to a
+    finite float, so every partial sum compares totally
+    """
+    if all(type(value) is int for value in values):
+        return True
+    if not all(type(value) is int or type(value) is float for value in values):
+        return False
+    try:
+        return math.isfinite(sum(map(abs, values)))
+    except OverflowError:
+        return False
+
+
 class GreedyAlgorithmSolver(Algorithm):
     """
     Greedy algorithm solver
@@ -29,9 +46,12 @@ class GreedyAlgorithmSolver(Algorithm):
         ```
     """
     
+    DEFAULT_NAME = "Greedy Algorithm Solver"
+    REQUIRED_FIELDS = ("problem_type",)
+    
     def __init__(self, **data):
         if "name" not in data:
-            data["name"] = "Greedy Algorithm Solver"
+            data["name"] = self.DEFAULT_NAME
         if "type" not in data:
             data["type"] = AlgorithmType.PROBLEM_SOLVING
         if "strategy" not in data:
@@ -41,40 +61,34 @@ class GreedyAlgorithmSolver(Algorithm):
         
         super().__init__(**data)
     
-    def _validate_input(self, input_data: Dict[str, Any]) -> None:
-        """Validate input for greedy algorithm"""
-        super()._validate_input(input_data)
-        
-        if "problem_type" not in input_data:
-            raise ValueError("Missing required field: problem_type")
+    # Problem handlers keyed on problem_type, replacing an if/elif chain
+    _PROBLEM_HANDLERS = {
+        "activity_selection": lambda self, data: self._activity_selection(
+            data.get("activities", [])
+        ),
+        "fractional_knapsack": lambda self, data: self._fractional_knapsack(
+            data.get("items", []), data.get("capacity", 0)
+        ),
+        "huffman_coding": lambda self, data: self._huffman_coding(data.get("frequencies", {})),
+        "interval_scheduling": lambda self, data: self._interval_scheduling(
+            data.get("intervals", [])
+        ),
+        "job_sequencing": lambda self, data: self._job_sequencing(data.get("jobs", [])),
+        "minimum_coins": lambda self, data: self._minimum_coins(
+            data.get("coins", []), data.get("amount", 0)
+        ),
+        "task_assignment": lambda self, data: self._task_assignment(
+            data.get("tasks", []), data.get("workers", [])
+        ),
+    }
     
     def _execute_core(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute greedy algorithm"""
         problem_type = input_data["problem_type"]
         
-        if problem_type == "activity_selection":
-            result = self._activity_selection(input_data.get("activities", []))
-        elif problem_type == "fractional_knapsack":
-            result = self._fractional_knapsack(
-                input_data.get("items", []),
-                input_data.get("capacity", 0)
-            )
-        elif problem_type == "huffman_coding":
-            result = self._huffman_coding(input_data.get("frequencies", {}))
-        elif problem_type == "interval_scheduling":
-            result = self._interval_scheduling(input_data.get("intervals", []))
-        elif problem_type == "job_sequencing":
-            result = self._job_sequencing(input_data.get("jobs", []))
-        elif problem_type == "minimum_coins":
-            result = self._minimum_coins(
-                input_data.get("coins", []),
-                input_data.get("amount", 0)
-            )
-        elif problem_type == "task_assignment":
-            result = self._task_assignment(
-                input_data.get("tasks", []),
-                input_data.get("workers", [])
-            )
+        handler = self._PROBLEM_HANDLERS.get(problem_type)
+        if handler is not None:
+            result = handler(self, input_data)
         else:
             result = {"error": f"Unknown problem type: {problem_type}"}
         
@@ -90,12 +104,15 @@ class GreedyAlgorithmSolver(Algorithm):
             return {"selected": [], "count": 0}
         
         # Sort by end time
-        sorted_activities = sorted(activities, key=lambda x: x["end"])
+        sorted_activities = sorted(activities, key=itemgetter("end"))
         
         selected = [sorted_activities[0]]
         last_end = sorted_activities[0]["end"]
         
-        for activity in sorted_activities[1:]:
+        # Walk the rest in place rather than through a copied slice
+        remaining = iter(sorted_activities)
+        next(remaining)
+        for activity in remaining:
             if activity["start"] >= last_end:
                 selected.append(activity)
                 last_end = activity["end"]
@@ -115,18 +132,21 @@ class GreedyAlgorithmSolver(Algorithm):
         if not items or capacity <= 0:
             return {"max_value": 0, "items": []}
         
-        # Calculate value per weight and sort
-        for item in items:
-            item["ratio"] = item["value"] / item["weight"]
-        
-        sorted_items = sorted(items, key=lambda x: x["ratio"], reverse=True)
+        # Sort by value per weight, computed in the key rather than stored
+        # on the items, so the caller's dicts are left untouched
+        sorted_items = sorted(
+            items, key=lambda x: x["value"] / x["weight"], reverse=True
+        )
+        # Once the capacity is used up exactly, no positive weight still fits
+        all_positive = all(item["weight"] > 0 for item in items)
         
         total_value = 0.0
         selected_items = []
         remaining_capacity = capacity
         
         for item in sorted_items:
-            if remaining_capacity >= item["weight"]:
+            weight = item["weight"]
+            if remaining_capacity >= weight:
                 # Take whole item
                 selected_items.append({
                     "item": item,
@@ -134,10 +154,12 @@ class GreedyAlgorithmSolver(Algorithm):
                     "value": item["value"]
                 })
                 total_value += item["value"]
-                remaining_capacity -= item["weight"]
+                remaining_capacity -= weight
+                if remaining_capacity == 0 and all_positive:
+                    break
             elif remaining_capacity > 0:
                 # Take fraction
-                fraction = remaining_capacity / item["weight"]
+                fraction = remaining_capacity / weight
                 selected_items.append({
                     "item": item,
                     "fraction": fraction,
@@ -158,42 +180,41 @@ class GreedyAlgorithmSolver(Algorithm):
         if not frequencies:
             return {"codes": {}, "tree": None}
         
-        # Create heap of (frequency, unique_id, character, left, right)
-        heap = [[freq, i, char, None, None] 
-                for i, (char, freq) in enumerate(frequencies.items())]
+        # Nodes live in parallel lists indexed by id: ids below len(chars)
+        # are leaves, and internal node n + k has children left[k] and
+        # right[k]; the heap holds only (frequency, id) pairs
+        chars = list(frequencies)
+        n = len(chars)
+        heap = [(freq, i) for i, freq in enumerate(frequencies.values())]
         heapq.heapify(heap)
-        
-        unique_id = len(frequencies)
+        left, right = [], []
         
         # Build Huffman tree
+        unique_id = n
         while len(heap) > 1:
-            left = heapq.heappop(heap)
-            right = heapq.heappop(heap)
-            
-            merged = [
-                left[0] + right[0],  # Combined frequency
-                unique_id,
-                None,  # Internal node has no character
-                left,
-                right
-            ]
-            heapq.heappush(heap, merged)
+            left_freq, left_id = heapq.heappop(heap)
+            right_freq, right_id = heapq.heappop(heap)
+            left.append(left_id)
+            right.append(right_id)
+            heapq.heappush(heap, (left_freq + right_freq, unique_id))
             unique_id += 1
         
-        # Generate codes
-        codes = {}
-        
-        def generate_codes(node, code=""):
-            if node[2] is not None:  # Leaf node
-                codes[node[2]] = code if code else "0"
-            else:  # Internal node
-                if node[3]:  # Left child
-                    generate_codes(node[3], code + "0")
-                if node[4]:  # Right child
-                    generate_codes(node[4], code + "1")
-        
-        if heap:
-            generate_codes(heap[0])
+        # Generate codes top down: children always have smaller ids than
+        # their parent, so walking internal nodes from the root (the last
+        # one made) extends every code from its parent's without a stack or
+        # recursion. The codes are prefix-free, so ordering leaves by code
+        # lists them left branch first, as a depth-first walk would
+        code = [""] * unique_id
+        for k in range(len(left) - 1, -1, -1):
+            parent_code = code[n + k]
+            code[left[k]] = parent_code + "0"
+            code[right[k]] = parent_code + "1"
+        
+        codes = {
+            chars[leaf]: code[leaf] or "0"
+            for leaf in sorted(range(n), key=code.__getitem__)
+            if chars[leaf] is not None
+        }
         
         # Calculate compression ratio
         original_bits = sum(frequencies.values()) * 8  # Assuming 8 bits per char
@@ -214,27 +235,38 @@ class GreedyAlgorithmSolver(Algorithm):
         if not jobs:
             return {"scheduled_jobs": [], "total_profit": 0}
         
-        # Sort by profit (descending)
-        sorted_jobs = sorted(jobs, key=lambda x: x.get("profit", 0), reverse=True)
+        # Read each job's profit and deadline once, then sort by profit
+        # (descending)
+        decoded = [(job.get("profit", 0), job.get("deadline", 1), job) for job in jobs]
+        decoded.sort(key=itemgetter(0), reverse=True)
         
         # Find maximum deadline
-        max_deadline = max(job.get("deadline", 1) for job in sorted_jobs)
+        max_deadline = max(deadline for _, deadline, _ in decoded)
         
-        # Schedule jobs
-        schedule = [None] * max_deadline
+        # Schedule jobs. Slots are numbered 1..max_deadline, and free[t]
+        # leads (through a path-compressed chain) to the latest free slot
+        # at or before t, 0 meaning none is left, so each job finds its
+        # slot without scanning the taken ones
+        free = list(range(max_deadline + 1))
         total_profit = 0
         scheduled = []
         
-        for job in sorted_jobs:
-            deadline = job.get("deadline", 1)
+        for profit, deadline, job in decoded:
+            latest = min(deadline, max_deadline)
+            if latest < 1:
+                continue
             
             # Find free slot before deadline
-            for slot in range(min(deadline, max_deadline) - 1, -1, -1):
-                if schedule[slot] is None:
-                    schedule[slot] = job
-                    scheduled.append(job)
-                    total_profit += job.get("profit", 0)
-                    break
+            slot = latest
+            while free[slot] != slot:
+                slot = free[slot]
+            while free[latest] != slot:
+                free[latest], latest = slot, free[latest]
+            
+            if slot:
+                free[slot] = free[slot - 1]
+                scheduled.append(job)
+                total_profit += profit
         
         return {
             "scheduled_jobs": scheduled,
@@ -258,6 +290,13 @@ class GreedyAlgorithmSolver(Algorithm):
         remaining = amount
         
         for coin in coins_sorted:
+            if (type(coin) is int and coin > 0
+                    and type(remaining) is int and remaining >= 0):
+                # Whole coins at once; repeated subtraction would round
+                # differently for floats, and never ends for coins <= 0
+                count, remaining = divmod(remaining, coin)
+                coins_used.extend([coin] * count)
+                continue
             while remaining >= coin:
                 coins_used.append(coin)
                 remaining -= coin
@@ -300,26 +339,55 @@ class GreedyAlgorithmSolver(Algorithm):
         
         assignments = []
         worker_load = {worker.get("id", i): 0 for i, worker in enumerate(workers)}
-        
-        for task in sorted_tasks:
-            # Find best available worker
-            best_worker = None
-            min_load = float('inf')
-            
-            for worker in sorted_workers:
-                worker_id = worker.get("id", workers.index(worker))
-                if worker_load[worker_id] < min_load:
-                    min_load = worker_load[worker_id]
-                    best_worker = worker
+        # A worker without an id is known by the position of the first
+        # worker equal to it; worked out once rather than on every task
+        worker_ids = [
+            worker["id"] if "id" in worker else workers.index(worker)
+            for worker in sorted_workers
+        ]
+        durations = [task.get("duration", 1) for task in sorted_tasks]
+        
+        if _has_finite_sums(durations):
+            # Loads stay totally ordered, so the least loaded worker, ties
+            # going to the first in skill order, is the top of a heap of
+            # (load, rank, id); workers sharing an id share one load, and
+            # only the first of them in skill order can ever be chosen
+            first_rank = {}
+            for rank, worker_id in enumerate(worker_ids):
+                first_rank.setdefault(worker_id, rank)
+            heap = [(worker_load[worker_id], rank, worker_id)
+                    for worker_id, rank in first_rank.items()]
+            heapq.heapify(heap)
             
-            if best_worker:
-                worker_id = best_worker.get("id", workers.index(best_worker))
-                assignments.append({
-                    "task": task,
-                    "worker": best_worker,
-                    "worker_id": worker_id
-                })
-                worker_load[worker_id] += task.get("duration", 1)
+            for task, duration in zip(sorted_tasks, durations):
+                load, rank, worker_id = heap[0]
+                best_worker = sorted_workers[rank]
+                if best_worker:
+                    assignments.append({
+                        "task": task,
+                        "worker": best_worker,
+                        "worker_id": worker_id
+                    })
+                    worker_load[worker_id] = load + duration
+                    heapq.heapreplace(heap, (load + duration, rank, worker_id))
+        else:
+            for task, duration in zip(sorted_tasks, durations):
+                # Find best available worker
+                best_worker = None
+                min_load = float('inf')
+                
+                for worker, worker_id in zip(sorted_workers, worker_ids):
+                    if worker_load[worker_id] < min_load:
+                        min_load = worker_load[worker_id]
+                        best_worker, best_id = worker, worker_id
+                
+                if best_worker:
+                    assignments.append({
+                        "task": task,
+                        "worker": best_worker,
+                        "worker_id": best_id
+                    })
+                    worker_load[best_id] += duration
         
         return {
             "assignments": assignments,
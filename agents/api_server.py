@@ -6,14 +6,24 @@ autonomous application builder system.
 """
 
 import asyncio
+import json
 import logging
+import uuid
+from collections import OrderedDict
+from itertools import islice
 from typing import Dict, List, Optional
 from datetime import datetime, timezone
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
 
 from .base import Task, TaskStatus, TaskPriority
 from .orchestrator import AgentOrchestrator
@@ -29,9 +39,18 @@ logger = logging.getLogger(__name__)
 # Global instances
 orchestrator: Optional[AgentOrchestrator] = None
 builder: Optional[ApplicationBuilder] = None
-active_builds: Dict[str, Dict] = {}
+# Builds in start order; once a run ends its build moves behind the others,
+# and past MAX_ACTIVE_BUILDS the oldest ended builds move to archived_builds,
+# which keeps the most recent MAX_ARCHIVED_BUILDS of them
+active_builds: "OrderedDict[str, Dict]" = OrderedDict()
+archived_builds: "OrderedDict[str, Dict]" = OrderedDict()
 websocket_connections: List[WebSocket] = []
 
+MAX_ACTIVE_BUILDS = 1024
+MAX_ARCHIVED_BUILDS = 1024
+# Active builds whose execute_build task has finished with them
+_ended_builds: set = set()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -148,8 +167,9 @@ async def create_build(request: BuildRequest):
         success_criteria=request.success_criteria
     )
     
-    # Generate build ID
-    build_id = f"build_{datetime.now(timezone.utc).timestamp()}"
+    # Generate build ID; random rather than time based, so builds started
+    # in the same instant cannot overwrite each other
+    build_id = f"build_{uuid.uuid4().hex}"
     
     # Store build info
     active_builds[build_id] = {
@@ -181,33 +201,9 @@ async def create_build(request: BuildRequest):
     )
 
 
-@app.get("/api/v1/builds", response_model=List[BuildStatus])
-async def list_builds():
-    """List all builds"""
-    return [
-        BuildStatus(
-            build_id=build["id"],
-            title=build["title"],
-            status=build["status"],
-            current_phase=build.get("current_phase"),
-            progress=build.get("progress", 0.0),
-            phases_completed=build.get("phases_completed", []),
-            started_at=build["started_at"],
-            estimated_completion=build.get("estimated_completion")
-        )
-        for build in active_builds.values()
-    ]
-
-
-@app.get("/api/v1/builds/{build_id}", response_model=BuildStatus)
-async def get_build_status(build_id: str):
-    """Get status of a specific build"""
-    if build_id not in active_builds:
-        raise HTTPException(status_code=404, detail="Build not found")
-    
-    build = active_builds[build_id]
-    
-    return BuildStatus(
+def _build_status(build: Dict) -> BuildStatus:
+    """Status view of a stored build; the stored fields are already valid"""
+    return BuildStatus.model_construct(
         build_id=build["id"],
         title=build["title"],
         status=build["status"],
@@ -219,16 +215,56 @@ async def get_build_status(build_id: str):
     )
 
 
+def _find_build(build_id: str) -> Dict:
+    """Look a build up among active and archived builds"""
+    build = active_builds.get(build_id)
+    if build is None:
+        build = archived_builds.get(build_id)
+    if build is None:
+        raise HTTPException(status_code=404, detail="Build not found")
+    return build
+
+
+def _page(builds: "OrderedDict[str, Dict]", offset: int, limit: Optional[int]) -> List[BuildStatus]:
+    """Status views for one page of builds"""
+    stop = None if limit is None else offset + limit
+    return [_build_status(build) for build in islice(builds.values(), offset, stop)]
+
+
+@app.get("/api/v1/builds", response_model=List[BuildStatus])
+async def list_builds(
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1)
+):
+    """List builds, optionally one page at a time"""
+    return _page(active_builds, offset, limit)
+
+
+@app.get("/api/v1/builds/archived", response_model=List[BuildStatus])
+async def list_archived_builds(
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1)
+):
+    """List archived builds, oldest first, optionally one page at a time"""
+    return _page(archived_builds, offset, limit)
+
+
+@app.get("/api/v1/builds/{build_id}", response_model=BuildStatus)
+async def get_build_status(build_id: str):
+    """Get status of a specific build"""
+    return _build_status(_find_build(build_id))
+
+
 @app.delete("/api/v1/builds/{build_id}")
 async def cancel_build(build_id: str):
     """Cancel a running build"""
-    if build_id not in active_builds:
-        raise HTTPException(status_code=404, detail="Build not found")
-    
-    build = active_builds[build_id]
+    build = _find_build(build_id)
     
     if build["status"] == "completed":
         raise HTTPException(status_code=400, detail="Build already completed")
+    # Archived builds, and active ones whose run is over, keep their final status
+    if build_id in _ended_builds or build_id in archived_builds:
+        raise HTTPException(status_code=400, detail=f"Build already {build['status']}")
     
     build["status"] = "cancelled"
     
@@ -302,11 +338,11 @@ async def websocket_endpoint(websocket: WebSocket):
     
     try:
         # Send initial connection message
-        await websocket.send_json({
+        await websocket.send_text(_encode_message({
             "type": "connected",
             "message": "Connected to Application Builder",
             "timestamp": datetime.now(timezone.utc).isoformat()
-        })
+        }))
         
         # Keep connection alive and handle incoming messages
         while True:
@@ -391,21 +427,71 @@ async def execute_build(build_id: str, idea: ApplicationIdea, autonomous: bool):
             "build_id": build_id,
             "error": str(e)
         })
+    
+    finally:
+        # Even if the failure broadcast raises, the ended build is archived
+        _archive_ended_builds(build_id)
+
+
+def _archive_ended_builds(build_id: str) -> None:
+    """
+    Move a build whose run has ended behind the others, then archive the
+    oldest ended builds while more than MAX_ACTIVE_BUILDS are kept; running
+    builds stay, as their execute_build task still updates them
+    """
+    active_builds.move_to_end(build_id)
+    _ended_builds.add(build_id)
+    while len(active_builds) > MAX_ACTIVE_BUILDS:
+        oldest_id = next((bid for bid in active_builds if bid in _ended_builds), None)
+        if oldest_id is None:
+            break
+        _ended_builds.discard(oldest_id)
+        archived_builds[oldest_id] = active_builds.pop(oldest_id)
+        if len(archived_builds) > MAX_ARCHIVED_BUILDS:
+            archived_builds.popitem(last=False)
+
+
+def _encode_message(message: Dict) -> str:
+    """
+    Compact JSON text for a WebSocket message; orjson encodes it when
+    installed. Messages stay text frames, which is what clients already parse.
+    
+    Without orjson this is the text send_json would send. With it the
+    output is equivalent JSON, not identical text: some floats are spelled
+    differently (1e16 rather than 1e+16) and NaN or infinities become null.
+    Non-str keys are stringified either way.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
 
 
 async def broadcast_message(message: Dict):
-    """Broadcast a message to all connected WebSocket clients"""
-    disconnected = []
+    """
+    Broadcast a message to all connected WebSocket clients
     
-    for ws in websocket_connections:
-        try:
-            await ws.send_json(message)
-        except Exception:
-            disconnected.append(ws)
+    The message is encoded once and sent to every client concurrently
+    rather than one after another.
+    """
+    if not websocket_connections:
+        return
+    
+    try:
+        payload = _encode_message(message)
+    except (TypeError, ValueError) as e:
+        # An unencodable message must not fail the build that sent it
+        logger.error(f"Dropped unencodable broadcast {message.get('type')!r}: {e}")
+        return
+    connections = list(websocket_connections)
+    results = await asyncio.gather(
+        *(ws.send_text(payload) for ws in connections),
+        return_exceptions=True
+    )
     
-    # Remove disconnected clients
-    for ws in disconnected:
-        websocket_connections.remove(ws)
+    # Remove disconnected clients; the endpoint may have dropped them already
+    for ws, result in zip(connections, results):
+        if isinstance(result, Exception) and ws in websocket_connections:
+            websocket_connections.remove(ws)
 
 
 def start_server(host: str = "0.0.0.0", port: int = 8000):
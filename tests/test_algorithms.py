@@ -0,0 +1,570 @@
+"""
+Tests for the algorithms package
+"""
+
+import ast
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.algorithms.base import (
+    AlgorithmConfig,
+    AlgorithmResult,
+    AlgorithmStrategy,
+    AlgorithmType,
+)
+from agents.algorithms.code_generation import (
+    AIAssistedCodeGenerator,
+    ASTBasedCodeGenerator,
+    PatternBasedCodeGenerator,
+    TemplateBasedCodeGenerator,
+)
+from agents.algorithms.problem_solving import (
+    BacktrackingSolver,
+    ConstraintSatisfactionSolver,
+    DynamicProgrammingSolver,
+    DivideAndConquerSolver,
+    GreedyAlgorithmSolver,
+)
+from agents.algorithms.optimization import AlgorithmOrchestrator
+
+
+class TestAlgorithmBase:
+    """Tests for the shared Algorithm behaviour"""
+
+    def test_defaults_applied(self):
+        """Test subclass defaults populate the base fields"""
+        generator = AIAssistedCodeGenerator()
+        assert generator.type == AlgorithmType.CODE_GENERATION
+        assert generator.strategy == AlgorithmStrategy.AI_ASSISTED
+        assert generator.id
+
+    def test_string_enums_coerced(self):
+        """Test enum fields accept their string values"""
+        generator = AIAssistedCodeGenerator(type="code_generation", strategy="ai_assisted")
+        assert generator.type is AlgorithmType.CODE_GENERATION
+        assert generator.strategy is AlgorithmStrategy.AI_ASSISTED
+
+    def test_metrics_tracking(self):
+        """Test success and failure counters"""
+        generator = AIAssistedCodeGenerator()
+        assert generator.execute({"prompt": "a function for fibonacci"}).success
+        assert not generator.execute({}).success
+
+        metrics = generator.get_metrics()
+        assert metrics["executions"] == 2
+        assert metrics["successes"] == 1
+        assert metrics["failures"] == 1
+        assert metrics["success_rate"] == 0.5
+
+    def test_package_exposes_subpackages(self):
+        """Test lazy package exports still include the subpackages"""
+        import agents.algorithms as algorithms
+        assert algorithms.problem_solving.GreedyAlgorithmSolver is GreedyAlgorithmSolver
+        assert algorithms.optimization.AlgorithmOrchestrator is AlgorithmOrchestrator
+        assert "code_generation" in dir(algorithms)
+
+    def test_config_dict_coerced(self):
+        """Test a plain dict config is validated into AlgorithmConfig"""
+        solver = GreedyAlgorithmSolver(config={"parallel_execution": True})
+        assert isinstance(solver.config, AlgorithmConfig)
+        assert solver.config.parallel_execution
+        assert len(solver.execute_batch([{"problem_type": "minimum_coins", "coins": [1], "amount": 2}])) == 1
+
+    def test_execute_batch_parallel(self):
+        """Test batch execution keeps order and counts every run"""
+        solver = DynamicProgrammingSolver(config=AlgorithmConfig(parallel_execution=True))
+        inputs = [{"problem_type": "fibonacci", "n": n} for n in range(20)]
+
+        results = solver.execute_batch(inputs)
+
+        assert [r.result_data["result"]["value"] for r in results[:8]] == [0, 1, 1, 2, 3, 5, 8, 13]
+        assert solver.executions_count == 20
+        assert solver.success_count == 20
+
+    def test_result_fields(self):
+        """Test result carries timing and timestamp"""
+        result = AIAssistedCodeGenerator().execute({"prompt": "create a class"})
+        assert isinstance(result, AlgorithmResult)
+        assert result.execution_time_ms >= 0
+        assert result.timestamp.tzinfo is not None
+        assert result.metadata["input_keys"] == ["prompt"]
+
+    def test_ai_context_cache_keeps_value_types(self):
+        """Test equal-comparing context values build their own prompts"""
+        generator = AIAssistedCodeGenerator()
+        codes = [
+            generator.execute({"prompt": "a parser", "context": {"framework": value}})
+            .result_data["generated_code"]
+            for value in (2, 2.0, True)
+        ]
+        assert "Use framework: 2\n" in codes[0]
+        assert "Use framework: 2.0\n" in codes[1]
+        assert "Use framework: True\n" in codes[2]
+
+
+class TestCodeGeneration:
+    """Tests for code generation algorithms"""
+
+    def test_template_generation(self):
+        """Test template substitution"""
+        result = TemplateBasedCodeGenerator().execute({
+            "template_name": "function_definition",
+            "language": "python",
+            "variables": {
+                "function_name": "add",
+                "parameters": "a, b",
+                "return_type": "int",
+                "description": "Add numbers",
+                "body": "result = a + b",
+                "return_value": "result",
+            },
+        })
+        assert result.success
+        assert "def add(a, b) -> int:" in result.result_data["generated_code"]
+
+    def test_custom_template_replaces_cached_render(self):
+        """Test re-registering a template is not masked by cached output"""
+        generator = TemplateBasedCodeGenerator()
+        request = {"template_name": "greeting", "language": "text", "variables": {"name": "Ada"}}
+
+        generator.add_custom_template("text", "greeting", "Hello ${name}")
+        assert generator.execute(request).result_data["generated_code"] == "Hello Ada"
+
+        generator.add_custom_template("text", "greeting", "Bye ${name}")
+        assert generator.execute(request).result_data["generated_code"] == "Bye Ada"
+
+    def test_subclass_templates_compiled(self):
+        """Test a subclass with its own TEMPLATES renders from them"""
+        class GreetingGenerator(TemplateBasedCodeGenerator):
+            TEMPLATES = {"text": {"greeting": "Hi ${name}"}}
+
+        generator = GreetingGenerator()
+        result = generator.execute({
+            "template_name": "greeting",
+            "language": "text",
+            "variables": {"name": "Ada"},
+        })
+        assert result.result_data["generated_code"] == "Hi Ada"
+        assert generator.list_templates() == {"text": ["greeting"]}
+
+    def test_ast_function_generation(self):
+        """Test AST-based function generation"""
+        result = ASTBasedCodeGenerator().execute({
+            "ast_type": "function",
+            "name": "calculate_sum",
+            "parameters": ["a", "b"],
+            "body": [
+                {"type": "assign", "target": "result", "value": "a + b"},
+                {"type": "return", "value": "result"},
+            ],
+        })
+        assert result.success
+        assert result.result_data["is_valid"]
+        assert result.result_data["generated_code"] == (
+            "def calculate_sum(a, b):\n    result = a + b\n    return result"
+        )
+
+    def test_ast_builder_overrides(self):
+        """Test subclass overrides of node builders are dispatched to"""
+        class PrefixedGenerator(ASTBasedCodeGenerator):
+            def _generate_function_ast(self, data):
+                node = super()._generate_function_ast(data)
+                node.name = f"traced_{node.name}"
+                return node
+
+        generator = PrefixedGenerator()
+        function = generator.execute({"ast_type": "function", "name": "f"})
+        module = generator.execute({
+            "ast_type": "module",
+            "statements": [{"type": "function", "name": "g"}],
+        })
+        assert function.result_data["generated_code"].startswith("def traced_f():")
+        assert module.result_data["generated_code"].startswith("def traced_g():")
+
+    def test_ast_invalid_identifier(self):
+        """Test invalid names are rejected"""
+        result = ASTBasedCodeGenerator().execute({"ast_type": "function", "name": "not valid"})
+        assert not result.success
+        assert "Invalid identifier" in result.error
+
+    def test_ast_parameter_and_base_forms(self):
+        """Test dotted bases, class keywords, star-args and defaults stay valid"""
+        generator = ASTBasedCodeGenerator()
+        result = generator.execute({
+            "ast_type": "class",
+            "name": "Handler",
+            "bases": ["abc.ABC", "metaclass=abc.ABCMeta"],
+            "methods": [{
+                "name": "handle",
+                "parameters": ["self", "*args", "retries: int = 3", "**kwargs"],
+                "body": [{"type": "assign", "target": "self.last", "value": "args"}],
+            }],
+        })
+        assert result.success
+        code = result.result_data["generated_code"]
+        assert code.startswith("class Handler(abc.ABC, metaclass=abc.ABCMeta):")
+        assert "def handle(self, *args, retries: int=3, **kwargs):" in code
+        assert "self.last = args" in code
+        assert result.result_data["is_valid"]
+        ast.parse(code)
+
+    def test_ast_rejects_smuggled_code(self):
+        """Test fragments that would break out of their position are rejected"""
+        generator = ASTBasedCodeGenerator()
+        for spec in (
+            {"ast_type": "function", "name": "f", "parameters": ["a): pass\ndef g(b"]},
+            {"ast_type": "class", "name": "C", "bases": ["A): pass\nclass D(B"]},
+            {"ast_type": "function", "name": "f", "body": [
+                {"type": "assign", "target": "x = 1; y", "value": "2"},
+            ]},
+        ):
+            result = generator.execute(spec)
+            assert not result.success
+            assert "Invalid" in result.error
+
+    def test_pattern_generation(self):
+        """Test singleton pattern generation"""
+        result = PatternBasedCodeGenerator().execute({
+            "pattern": "singleton",
+            "class_name": "Database",
+            "additional_methods": ["connect"],
+        })
+        assert result.success
+        code = result.result_data["generated_code"]
+        assert "class Database:" in code
+        assert "def connect(self):" in code
+        assert "${" not in code
+
+    def test_pattern_values_not_resubstituted(self):
+        """Test placeholder text inside a value is emitted literally"""
+        result = PatternBasedCodeGenerator().execute({
+            "pattern": "singleton",
+            "class_name": "${additional_methods}",
+            "additional_methods": ["connect"],
+        })
+        code = result.result_data["generated_code"]
+        assert code.startswith("class ${additional_methods}:")
+        assert code.count("def connect(self):") == 1
+
+    def test_pattern_cache_key_uses_rendered_values(self):
+        """Test equal-comparing and unhashable values render as themselves"""
+        generator = PatternBasedCodeGenerator()
+        rendered = [
+            generator.execute({"pattern": "singleton", "class_name": value}).result_data["generated_code"]
+            for value in (1, True, 1.0, ["A"])
+        ]
+        assert [code.splitlines()[0] for code in rendered] == [
+            "class 1:", "class True:", "class 1.0:", "class ['A']:"
+        ]
+
+
+class TestProblemSolving:
+    """Tests for problem solving algorithms"""
+
+    def test_n_queens(self):
+        """Test N-Queens solution count"""
+        result = BacktrackingSolver().execute({"problem_type": "n_queens", "n": 6})
+        assert result.result_data["result"]["solutions_count"] == 4
+
+    def test_n_queens_collect_all(self):
+        """Test N-Queens lists every solution only on request"""
+        solver = BacktrackingSolver()
+        result = solver.execute({"problem_type": "n_queens", "n": 6, "collect_all": True})
+        assert result.result_data["result"]["solutions"] == [
+            [1, 3, 5, 0, 2, 4], [2, 5, 1, 4, 0, 3], [3, 0, 4, 1, 5, 2], [4, 2, 0, 5, 3, 1]
+        ]
+        result = solver.execute({"problem_type": "n_queens", "n": 6})
+        assert "solutions" not in result.result_data["result"]
+
+    def test_subset_sum_unique(self):
+        """Test subset sum reports repeated values once on request"""
+        solver = BacktrackingSolver()
+        data = {"problem_type": "subset_sum", "numbers": [2, 1, 2, 3, 1], "target": 4}
+        result = solver.execute(data)
+        assert result.result_data["result"]["solutions_count"] == 5
+        result = solver.execute({**data, "unique": True})
+        assert result.result_data["result"]["solutions"] == [[1, 1, 2], [1, 3], [2, 2]]
+
+    def test_merge_sort(self):
+        """Test merge sort"""
+        result = DivideAndConquerSolver().execute({
+            "problem_type": "merge_sort",
+            "data": [5, 2, 8, 1, 9],
+        })
+        assert result.result_data["result"] == [1, 2, 5, 8, 9]
+
+    def test_sort_strings(self):
+        """Test both sorts order plain strings"""
+        words = ["pear", "Apple", "fig", "apple", "", "fig"]
+        for problem_type in ("merge_sort", "quick_sort"):
+            result = DivideAndConquerSolver().execute({
+                "problem_type": problem_type,
+                "data": words,
+            })
+            assert result.result_data["result"] == ["", "Apple", "apple", "fig", "fig", "pear"]
+
+    def test_merge_sort_parallel(self, monkeypatch):
+        """Test the worker-process merge sort keeps the sequential order"""
+        from agents.algorithms.problem_solving import divide_conquer
+        monkeypatch.setattr(divide_conquer, "_PARALLEL_SORT_THRESHOLD", 16)
+        monkeypatch.setattr(divide_conquer.os, "cpu_count", lambda: 4)
+        data = [(i * 7 % 5, -i) for i in range(100)]
+        solver = DivideAndConquerSolver(config=AlgorithmConfig(parallel_execution=True))
+        result = solver.execute({"problem_type": "merge_sort", "data": data})
+        assert result.result_data["result"] == sorted(data)
+
+        # Called directly so a worker failure raises instead of falling back
+        items = list(data)
+        solver._parallel_merge_sort(items, 4)
+        assert items == sorted(data)
+
+    def test_binary_search_presorted(self):
+        """Test binary search on data the caller already sorted"""
+        solver = DivideAndConquerSolver()
+        for presorted in (False, True):
+            result = solver.execute({
+                "problem_type": "binary_search",
+                "data": [1, 3, 5, 7, 9, 11],
+                "target": 9,
+                "presorted": presorted,
+            })
+            assert result.result_data["result"]["index"] == 4
+
+    def test_closest_pair(self):
+        """Test closest pair agrees with checking every pair"""
+        points = [(x * 7 % 101, x * 13 % 97) for x in range(200)]
+        result = DivideAndConquerSolver().execute({
+            "problem_type": "closest_pair",
+            "points": points,
+        })
+        closest = result.result_data["result"]
+        pairs = [(points[i], points[j]) for i in range(200) for j in range(i + 1, 200)]
+        distances = [((p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2) ** 0.5 for p, q in pairs]
+        assert closest["distance"] == min(distances)
+        assert closest["points"] == pairs[distances.index(min(distances))]
+
+    def test_edit_distance(self):
+        """Test Levenshtein distance"""
+        result = DynamicProgrammingSolver().execute({
+            "problem_type": "edit_distance",
+            "str1": "kitten",
+            "str2": "sitting",
+        })
+        assert result.result_data["result"]["distance"] == 3
+
+    def test_edit_distance_operations(self):
+        """Test the edit alignment rebuilds both strings at the same cost"""
+        result = DynamicProgrammingSolver().execute({
+            "problem_type": "edit_distance",
+            "str1": "intention",
+            "str2": "execution",
+            "include_operations": True,
+        })
+        edit = result.result_data["result"]
+        operations = edit["operations"]
+        assert edit["distance"] == 5
+        assert "".join(c1 for op, c1, _ in operations if op != "insert") == "intention"
+        assert "".join(c2 for op, _, c2 in operations if op != "delete") == "execution"
+        assert sum(op != "match" for op, _, _ in operations) == 5
+
+    def test_longest_increasing_subsequence(self):
+        """Test LIS keeps the earliest subsequence among equal lengths"""
+        result = DynamicProgrammingSolver().execute({
+            "problem_type": "longest_increasing_subsequence",
+            "sequence": [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9],
+        })
+        lis = result.result_data["result"]
+        assert lis["length"] == 6
+        assert lis["subsequence"] == [3, 4, 5, 6, 8, 9]
+
+    def test_map_coloring(self):
+        """Test map coloring finds a consistent assignment"""
+        constraints = [("WA", "NT"), ("WA", "SA"), ("NT", "SA"), ("NT", "Q"),
+                       ("SA", "Q"), ("SA", "NSW"), ("SA", "V"), ("Q", "NSW"),
+                       ("NSW", "V")]
+        variables = ["WA", "NT", "SA", "Q", "NSW", "V", "T"]
+        result = ConstraintSatisfactionSolver().execute({
+            "problem_type": "map_coloring",
+            "variables": variables,
+            "domains": {v: ["red", "green", "blue"] for v in variables},
+            "constraints": constraints,
+        })
+        solution = result.result_data["result"]["solution"]
+        assert solution is not None
+        assert all(solution[a] != solution[b] for a, b in constraints)
+
+    def test_generic_csp_arc_consistency(self):
+        """Test arc consistency rules out a chain of forced values"""
+        result = ConstraintSatisfactionSolver().execute({
+            "problem_type": "generic",
+            "variables": ["a", "b", "c"],
+            "domains": {"a": [1], "b": [1, 2], "c": [2, 3]},
+            "constraints": [("a", "b"), ("b", "c")],
+        })
+        assert result.result_data["result"]["solution"] == {"a": 1, "b": 2, "c": 3}
+
+        result = ConstraintSatisfactionSolver().execute({
+            "problem_type": "generic",
+            "variables": ["a", "b", "c"],
+            "domains": {"a": [1], "b": [1, 2], "c": [2]},
+            "constraints": [("a", "b"), ("b", "c")],
+        })
+        assert result.result_data["result"]["satisfied"] is False
+
+    def test_generic_csp_backjumping(self):
+        """Test a dead end jumps past unrelated assignments"""
+        free = [f"x{i}" for i in range(20)]
+        clique = ["a", "b", "c", "d"]
+        domains = {v: [0, 1] for v in free}
+        domains.update({v: [0, 1, 2] for v in clique})
+        result = ConstraintSatisfactionSolver().execute({
+            "problem_type": "generic",
+            "variables": free + clique,
+            "domains": domains,
+            "constraints": [(u, v) for i, u in enumerate(clique) for v in clique[i + 1:]],
+        })
+        assert result.result_data["result"]["satisfied"] is False
+
+    def test_cryptarithmetic(self):
+        """Test SEND + MORE = MONEY"""
+        result = ConstraintSatisfactionSolver().execute({
+            "problem_type": "cryptarithmetic",
+            "equation": "SEND + MORE = MONEY",
+        })
+        solution = result.result_data["result"]["solution"]
+        assert solution == {"S": 9, "E": 5, "N": 6, "D": 7, "M": 1, "O": 0, "R": 8, "Y": 2}
+
+    def test_fractional_knapsack(self):
+        """Test fractional knapsack fills by value per weight"""
+        items = [
+            {"weight": 10, "value": 60},
+            {"weight": 20, "value": 100},
+            {"weight": 30, "value": 120},
+        ]
+        result = GreedyAlgorithmSolver().execute({
+            "problem_type": "fractional_knapsack",
+            "items": items,
+            "capacity": 50,
+        })
+        knapsack = result.result_data["result"]
+        assert knapsack["max_value"] == 240
+        assert [taken["fraction"] for taken in knapsack["items"]] == [1.0, 1.0, 20 / 30]
+        assert all("ratio" not in item for item in items)
+
+    def test_huffman_coding(self):
+        """Test Huffman codes are prefix-free and handle very deep trees"""
+        frequencies = {"a": 45, "b": 13, "c": 12, "d": 16, "e": 9, "f": 5}
+        result = GreedyAlgorithmSolver().execute({
+            "problem_type": "huffman_coding",
+            "frequencies": frequencies,
+        })
+        codes = result.result_data["result"]["codes"]
+        assert codes == {"a": "0", "c": "100", "b": "101", "f": "1100", "e": "1101", "d": "111"}
+
+        fib = [1, 1]
+        while len(fib) < 1500:
+            fib.append(fib[-1] + fib[-2])
+        result = GreedyAlgorithmSolver().execute({
+            "problem_type": "huffman_coding",
+            "frequencies": {f"s{i}": f for i, f in enumerate(fib)},
+        })
+        assert max(len(code) for code in result.result_data["result"]["codes"].values()) == 1499
+
+    def test_task_assignment(self):
+        """Test tasks go to the least loaded worker, ties by skill"""
+        result = GreedyAlgorithmSolver().execute({
+            "problem_type": "task_assignment",
+            "tasks": [
+                {"name": "t1", "priority": 3, "duration": 4},
+                {"name": "t2", "priority": 2, "duration": 1},
+                {"name": "t3", "priority": 1, "duration": 2},
+            ],
+            "workers": [{"id": "junior", "skill": 1}, {"id": "senior", "skill": 5}],
+        })
+        assignment = result.result_data["result"]
+        assert [a["worker_id"] for a in assignment["assignments"]] == ["senior", "junior", "junior"]
+        assert assignment["worker_load"] == {"junior": 3, "senior": 4}
+
+    def test_job_sequencing(self):
+        """Test job sequencing maximizes profit"""
+        result = GreedyAlgorithmSolver().execute({
+            "problem_type": "job_sequencing",
+            "jobs": [
+                {"id": "a", "deadline": 2, "profit": 100},
+                {"id": "b", "deadline": 1, "profit": 19},
+                {"id": "c", "deadline": 2, "profit": 27},
+                {"id": "d", "deadline": 1, "profit": 25},
+                {"id": "e", "deadline": 3, "profit": 15},
+            ],
+        })
+        assert result.result_data["result"]["total_profit"] == 142
+
+
+class TestAlgorithmOrchestrator:
+    """Tests for the algorithm orchestrator"""
+
+    def test_recommendation(self):
+        """Test algorithm recommendation"""
+        orchestrator = AlgorithmOrchestrator()
+        recommendation = orchestrator.recommend_algorithm({
+            "task": "code_generation",
+            "requirements": {"pattern": "singleton"},
+        })
+        assert recommendation["algorithm"] == "pattern"
+
+    def test_algorithms_built_on_demand(self):
+        """Test algorithms are only instantiated when first used"""
+        orchestrator = AlgorithmOrchestrator()
+        assert "greedy" in orchestrator.all_algorithms
+        assert not orchestrator.all_algorithms._instances
+
+        solver = orchestrator.all_algorithms["greedy"]
+        assert orchestrator.problem_solvers["greedy"] is solver
+        assert list(orchestrator.all_algorithms._instances) == ["greedy"]
+
+    def test_algorithm_metrics_refresh(self):
+        """Test cached metrics pick up executions, even direct ones"""
+        orchestrator = AlgorithmOrchestrator()
+        metrics = orchestrator.get_algorithm_metrics()
+        assert metrics["greedy"]["executions"] == 0
+        assert metrics["greedy"]["algorithm_id"] == "greedy"
+        assert metrics["greedy"]["algorithm_name"] == "Greedy Algorithm Solver"
+        assert not orchestrator.all_algorithms._instances
+
+        metrics["greedy"]["executions"] = 99
+        assert orchestrator.get_algorithm_metrics()["greedy"]["executions"] == 0
+
+        orchestrator.all_algorithms["greedy"].execute({
+            "problem_type": "minimum_coins",
+            "coins": [1],
+            "amount": 1,
+        })
+        assert orchestrator.get_algorithm_metrics()["greedy"]["executions"] == 1
+
+    def test_execution_history(self):
+        """Test executions are recorded"""
+        orchestrator = AlgorithmOrchestrator()
+        orchestrator.execute_with_algorithm("greedy", {
+            "problem_type": "minimum_coins",
+            "coins": [1, 5, 10],
+            "amount": 27,
+        })
+        history = orchestrator.get_execution_history()
+        assert len(history) == 1
+        assert history[0]["algorithm_used"] == "greedy"
+
+    def test_execution_history_bounded(self):
+        """Test history keeps only the most recent records"""
+        orchestrator = AlgorithmOrchestrator(max_history=3)
+        for amount in range(5):
+            orchestrator.execute_with_algorithm("greedy", {
+                "problem_type": "minimum_coins",
+                "coins": [1],
+                "amount": amount,
+            })
+        history = orchestrator.get_execution_history()
+        assert [record["problem"]["amount"] for record in history] == [2, 3, 4]
+        assert len(orchestrator.get_execution_history(limit=2)) == 2
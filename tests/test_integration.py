@@ -2,8 +2,12 @@
 Integration tests for the multi-agent system
 """
 
+import asyncio
+import json
 import sys
 import os
+from collections import OrderedDict
+
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -302,5 +306,82 @@ class TestMetricsAggregation:
         assert total_failed > 0
 
 
+class TestApiServer:
+    """Tests for the API server's message encoding"""
+
+    def test_encode_message_orjson_matches_json(self, monkeypatch):
+        """Test orjson and json encode WebSocket messages as equivalent JSON"""
+        pytest.importorskip("orjson")
+        pytest.importorskip("uvicorn")
+        api_server = pytest.importorskip("agents.api_server")
+        assert api_server.HAS_ORJSON
+
+        message = {
+            "type": "build_update",
+            "build_id": "build_0",
+            "progress": 0.5,
+            "logs": ["caf\u00e9", "\u2713 done"],
+            "result": {1: [True, None], "big": 1e16},
+        }
+        fast = api_server._encode_message(message)
+        monkeypatch.setattr(api_server, "HAS_ORJSON", False)
+        plain = api_server._encode_message(message)
+
+        assert json.loads(fast) == json.loads(plain)
+        assert "caf\u00e9" in fast and ", " not in fast
+
+    def test_broadcast_unencodable_message(self, monkeypatch):
+        """Test an unencodable broadcast is dropped without raising"""
+        api_server = pytest.importorskip("agents.api_server")
+
+        class RecordingSocket:
+            def __init__(self):
+                self.sent = []
+
+            async def send_text(self, text):
+                self.sent.append(text)
+
+        socket = RecordingSocket()
+        monkeypatch.setattr(api_server, "websocket_connections", [socket])
+
+        asyncio.run(api_server.broadcast_message({"type": "bad", "value": object()}))
+        asyncio.run(api_server.broadcast_message({"type": "ok"}))
+
+        assert [json.loads(text) for text in socket.sent] == [{"type": "ok"}]
+        assert api_server.websocket_connections == [socket]
+
+    def test_failed_build_archived_and_not_cancellable(self, monkeypatch):
+        """Test a build is archived even when its failure broadcast raises"""
+        api_server = pytest.importorskip("agents.api_server")
+        from fastapi import HTTPException
+
+        async def failing_broadcast(message):
+            raise RuntimeError("socket layer down")
+
+        monkeypatch.setattr(api_server, "broadcast_message", failing_broadcast)
+        monkeypatch.setattr(api_server, "active_builds", OrderedDict())
+        monkeypatch.setattr(api_server, "archived_builds", OrderedDict())
+        monkeypatch.setattr(api_server, "_ended_builds", set())
+        monkeypatch.setattr(api_server, "MAX_ACTIVE_BUILDS", 0)
+        api_server.active_builds["build_0"] = {
+            "id": "build_0",
+            "title": "Demo",
+            "status": "running",
+            "phases_completed": [],
+            "started_at": "2024-01-01T00:00:00+00:00",
+        }
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(api_server.execute_build("build_0", None, True))
+
+        assert not api_server.active_builds
+        assert api_server.archived_builds["build_0"]["status"] == "failed"
+
+        with pytest.raises(HTTPException) as excinfo:
+            asyncio.run(api_server.cancel_build("build_0"))
+        assert excinfo.value.status_code == 400
+        assert api_server.archived_builds["build_0"]["status"] == "failed"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])